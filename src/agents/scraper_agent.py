@@ -301,8 +301,10 @@ class ScraperAgent:
                 break
 
             else:
-                # DECISION 4: Should we retry?
-                if attempt < self.max_retries:
+                # DECISION 4: Should we retry? (Not for an oversized page:
+                # it will be just as large next time)
+                if (attempt < self.max_retries
+                        and status_code != ScraperTool.STATUS_TOO_LARGE):
                     # Calculate intelligent backoff
                     backoff_time = self._calculate_backoff(attempt, status_code)
 
@@ -343,15 +345,16 @@ class ScraperAgent:
                     self._log_decision(
                         url,
                         "give_up",
-                        f"Failed after {self.max_retries + 1} attempts (final status: {status_code})"
+                        f"Failed after {attempt + 1} attempts (final status: {status_code})"
                     )
 
                     decision_metadata['decisions_made'].append({
                         'decision': 'give_up',
-                        'total_attempts': self.max_retries + 1,
+                        'total_attempts': attempt + 1,
                         'final_status': status_code,
                         'error': error
                     })
+                    break
 
         return (html_content, success, decision_metadata)
 
@@ -295,7 +295,12 @@ class FlowController:
 
             if self.debug:
                 print(f"[FLOW] Cleaned {len(clean_text)} pages")
-                total_words = sum(len(text.split()) for text in clean_text.values())
+                # The cleaner already counted each page's words; summing
+                # those avoids re-splitting every cleaned text
+                total_words = sum(
+                    page['word_count']
+                    for page in result.metadata.get('clean_metadata', {}).values()
+                )
                 print(f"[FLOW] Total words extracted: {total_words}")
 
             # ═══════════════════════════════════════════════════
@@ -532,6 +537,10 @@ class FlowController:
             if html:
                 return (html, status_code, "")
 
+            # An oversized page will be just as large next time
+            if status_code == ScraperTool.STATUS_TOO_LARGE:
+                break
+
             # If not last attempt, wait before retrying
             if attempt < self.MAX_RETRIES - 1:
                 delay = self.RETRY_DELAY * (2 ** attempt)  # Exponential backoff
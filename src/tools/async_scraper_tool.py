@@ -66,7 +66,6 @@ no decision-making logic. Async doesn't make it an AGENT!
 
 FUTURE EXTENSIONS:
 ------------------
-  • Connection pooling for efficiency
   • Rate limiting across concurrent requests
   • Progress tracking for large batch fetches
   • Timeout per-URL and per-batch
@@ -81,6 +80,7 @@ DEBUGGING TIPS:
 
 import asyncio
 import aiohttp
+import math
 import time
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
@@ -119,6 +119,11 @@ class AsyncScraperTool:
         "Educational research crawler (async)"
     )
 
+    # Connection limits for the session shared by fetch_many(): total open
+    # connections, and open connections to any single host
+    MAX_CONNECTIONS = 100
+    MAX_CONNECTIONS_PER_HOST = 20
+
     def __init__(self, user_agent: Optional[str] = None, debug: bool = False):
         """
         Initialize the Async Scraper Tool.
@@ -131,11 +136,18 @@ class AsyncScraperTool:
         --------------
         AsyncScraperTool doesn't create a persistent aiohttp session
         in __init__ because sessions are async context managers.
-        Instead, we create sessions in the async methods.
+        Instead, we create sessions in the async methods: fetch_url() opens
+        one for its single request, and fetch_many() opens one for the
+        whole batch.
         """
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
         self.debug = debug
         self._fetch_history = []
+        self._total_fetches = 0
+        self._successes = 0
+        self._sum_response_time = 0.0
+        self._min_response_time = math.inf
+        self._max_response_time = 0.0
 
     async def fetch_url(
         self,
@@ -169,6 +181,28 @@ class AsyncScraperTool:
         This method can be suspended while waiting for network I/O,
         allowing other coroutines to execute in the meantime.
         """
+        async with self._new_session() as session:
+            return await self._fetch(session, url, timeout, headers)
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create a ClientSession with our connection limits and User-Agent."""
+        connector = aiohttp.TCPConnector(
+            limit=self.MAX_CONNECTIONS,
+            limit_per_host=self.MAX_CONNECTIONS_PER_HOST
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': self.user_agent}
+        )
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        timeout: int,
+        headers: Optional[Dict[str, str]]
+    ) -> Tuple[Optional[str], int, str, Dict]:
+        """Fetch one URL on an existing session. See fetch_url()."""
         start_time = time.time()
         metadata = {
             'url': url,
@@ -179,51 +213,46 @@ class AsyncScraperTool:
             'headers': {}
         }
 
-        # Prepare headers
-        request_headers = {'User-Agent': self.user_agent}
-        if headers:
-            request_headers.update(headers)
-
         if self.debug:
             print(f"\n[ASYNC SCRAPER] Fetching: {url}")
 
         try:
-            # ASYNC I/O: Create session and fetch
+            # ASYNC I/O: Fetch on the caller's session
             # TEACHING NOTE: aiohttp.ClientSession is the async equivalent
-            # of requests.Session. It must be used as async context manager.
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=request_headers,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                    allow_redirects=True
-                ) as response:
-                    # Calculate response time
-                    response_time = time.time() - start_time
-                    metadata['response_time'] = response_time
-                    metadata['final_url'] = str(response.url)
-                    metadata['headers'] = dict(response.headers)
-
-                    # Read response body asynchronously
-                    # TEACHING NOTE: response.text() is async, so we await it
-                    html_content = await response.text()
-                    metadata['content_length'] = len(html_content)
-
-                    # Check for HTTP errors
-                    if response.status >= 400:
-                        error_msg = f"HTTP {response.status}: {response.reason}"
-                        if self.debug:
-                            print(f"[ASYNC SCRAPER] ❌ Failed: {error_msg}")
-
-                        self._record_fetch(url, response.status, error_msg, metadata)
-                        return (None, response.status, error_msg, metadata)
-
-                    # Success!
+            # of requests.Session. The session's default User-Agent is
+            # merged with any custom headers for this request.
+            async with session.get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                allow_redirects=True
+            ) as response:
+                # Calculate response time
+                response_time = time.time() - start_time
+                metadata['response_time'] = response_time
+                metadata['final_url'] = str(response.url)
+                metadata['headers'] = dict(response.headers)
+
+                # Read response body asynchronously
+                # TEACHING NOTE: response.text() is async, so we await it
+                html_content = await response.text()
+                metadata['content_length'] = len(html_content)
+
+                # Check for HTTP errors
+                if response.status >= 400:
+                    error_msg = f"HTTP {response.status}: {response.reason}"
                     if self.debug:
-                        print(f"[ASYNC SCRAPER] ✓ Success: {len(html_content)} chars in {response_time:.2f}s")
+                        print(f"[ASYNC SCRAPER] ❌ Failed: {error_msg}")
 
-                    self._record_fetch(url, response.status, "", metadata)
-                    return (html_content, response.status, "", metadata)
+                    self._record_fetch(url, response.status, error_msg, metadata)
+                    return (None, response.status, error_msg, metadata)
+
+                # Success!
+                if self.debug:
+                    print(f"[ASYNC SCRAPER] ✓ Success: {len(html_content)} chars in {response_time:.2f}s")
+
+                self._record_fetch(url, response.status, "", metadata)
+                return (html_content, response.status, "", metadata)
 
         except asyncio.TimeoutError:
             error_msg = f"Request timeout after {timeout}s"
@@ -298,6 +327,15 @@ class AsyncScraperTool:
 
         asyncio.gather() runs all coroutines concurrently and waits
         for all to complete, returning results in original order.
+
+        PERFORMANCE NOTE:
+        -----------------
+        All fetches in the batch share one ClientSession, so URLs on the
+        same host reuse keep-alive connections instead of each opening
+        (and tearing down) a session and connection of its own. The
+        connector caps concurrency at MAX_CONNECTIONS in total and
+        MAX_CONNECTIONS_PER_HOST per host; extra fetches wait for a
+        free connection.
         """
         if self.debug:
             print(f"\n{'='*60}")
@@ -306,13 +344,14 @@ class AsyncScraperTool:
 
         start_time = time.time()
 
-        # Create coroutines for all URLs
-        # TEACHING NOTE: This doesn't start fetching yet, just creates tasks
-        fetch_tasks = [self.fetch_url(url, timeout) for url in urls]
+        async with self._new_session() as session:
+            # Create coroutines for all URLs
+            # TEACHING NOTE: This doesn't start fetching yet, just creates tasks
+            fetch_tasks = [self._fetch(session, url, timeout, None) for url in urls]
 
-        # Execute all concurrently and wait for all to complete
-        # TEACHING NOTE: asyncio.gather() is the key to concurrent execution
-        fetch_results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+            # Execute all concurrently and wait for all to complete
+            # TEACHING NOTE: asyncio.gather() is the key to concurrent execution
+            fetch_results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
 
         total_time = time.time() - start_time
 
@@ -350,27 +389,37 @@ class AsyncScraperTool:
             'timestamp': datetime.now()
         })
 
+        # Running totals, so get_fetch_stats() never rescans the history
+        response_time = metadata['response_time']
+        self._total_fetches += 1
+        if status_code == 200:
+            self._successes += 1
+        self._sum_response_time += response_time
+        if response_time < self._min_response_time:
+            self._min_response_time = response_time
+        if response_time > self._max_response_time:
+            self._max_response_time = response_time
+
     def get_fetch_stats(self) -> Dict:
-        """Get statistics about fetch history (not async)."""
-        if not self._fetch_history:
+        """Get statistics about fetch history (not async). O(1): reads running totals."""
+        total = self._total_fetches
+        if not total:
             return {
                 'total_fetches': 0,
                 'success_rate': 0.0,
                 'avg_response_time': 0.0
             }
 
-        total = len(self._fetch_history)
-        successes = sum(1 for f in self._fetch_history if f['status_code'] == 200)
-        response_times = [f['metadata']['response_time'] for f in self._fetch_history]
+        successes = self._successes
 
         return {
             'total_fetches': total,
             'successes': successes,
             'failures': total - successes,
-            'success_rate': successes / total if total > 0 else 0.0,
-            'avg_response_time': sum(response_times) / len(response_times) if response_times else 0.0,
-            'min_response_time': min(response_times) if response_times else 0.0,
-            'max_response_time': max(response_times) if response_times else 0.0
+            'success_rate': successes / total,
+            'avg_response_time': self._sum_response_time / total,
+            'min_response_time': self._min_response_time,
+            'max_response_time': self._max_response_time
         }
 
 
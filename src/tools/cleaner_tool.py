@@ -75,10 +75,248 @@ DEBUGGING TIPS:
   • Track extraction success rates by site structure
 """
 
-from bs4 import BeautifulSoup
+import copy
+import hashlib
+import json
+import os
 import re
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import sqlite3
+    from bs4 import BeautifulSoup
+    from lxml.etree import _Element
+
+
+# BeautifulSoup is imported on first use, not at module import.
+# bs4 is a heavy import (several MB of RSS); callers that only construct
+# a CleanerTool, or use the lxml-only fast paths, never pay for it.
+_SOUP_CLS = None
+
+
+def _get_soup_cls():
+    """Return the BeautifulSoup class, importing bs4 on the first call."""
+    global _SOUP_CLS
+    if _SOUP_CLS is None:
+        from bs4 import BeautifulSoup
+        _SOUP_CLS = BeautifulSoup
+    return _SOUP_CLS
+
+
+@lru_cache(maxsize=None)
+def _get_pruning_soup_cls(skip_tags: frozenset):
+    """
+    Return a BeautifulSoup subclass that never builds nodes for skip_tags.
+
+    The class is generated on first use for each skip set (bs4 stays a
+    lazy import). SoupStrainer can't do this job: bs4 only consults it for
+    top-level tags, so once <html> matches, every nested <script> is
+    still built.
+
+    Only use it with raw-text tags (script, style) and the lxml builder:
+    they hold no child tags, so "skip until the matching end tag" is exact.
+    html.parser needs the start tag returned to enter CDATA mode.
+    """
+    soup_cls = _get_soup_cls()
+
+    class _PruningSoup(soup_cls):
+        def reset(self):
+            super().reset()
+            self._skipping = None
+
+        def handle_starttag(self, name, *args, **kwargs):
+            if self._skipping is not None:
+                return None
+            if name in skip_tags:
+                # Flush pending text first, so the strings either side
+                # stay separate nodes, exactly as after Tag.extract()
+                self.endData()
+                self._skipping = name
+                return None
+            return super().handle_starttag(name, *args, **kwargs)
+
+        def handle_endtag(self, name, nsprefix=None):
+            if self._skipping is None:
+                super().handle_endtag(name, nsprefix)
+            elif name == self._skipping:
+                self._skipping = None
+
+        def handle_data(self, data):
+            if self._skipping is None:
+                super().handle_data(data)
+
+    return _PruningSoup
+
+
+@lru_cache(maxsize=None)
+def _shared_html_parser():
+    """
+    Return the one lxml HTML parser used by every fast-path parse.
+
+    PERFORMANCE NOTE:
+    -----------------
+    A plain etree.HTMLParser, not lxml.html's. lxml.html attaches a
+    Python element-class lookup to its parser, so every element the
+    walks touch gets a Python-level class decision; the plain parser
+    builds bare C-backed elements. Built once, so parser setup isn't
+    paid per call; lxml locks a parser during each parse, so sharing it
+    across threads is safe.
+
+    Comments are kept (remove_comments=False): dropping them at parse
+    time merges the text on either side into one string, while bs4 keeps
+    two, which changes the stripped and joined text.
+    """
+    from lxml import etree
+    return etree.HTMLParser()
+
+
+@lru_cache(maxsize=None)
+def _substring_matcher(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Build a test for "does this text contain any of these patterns?".
+
+    With pyahocorasick installed this is an Aho-Corasick automaton, which
+    finds every pattern in one left-to-right pass over the text no matter
+    how many patterns there are. Otherwise it falls back to one regex
+    alternation. Built once per pattern tuple and cached.
+
+    PERFORMANCE NOTE:
+    -----------------
+    Callers lowercase the text instead of matching case-insensitively:
+    re.IGNORECASE defeats the regex engine's literal-prefix scan, and a
+    .lower() plus a case-sensitive search measured ~6x faster. The
+    automaton was ~10x faster than the original IGNORECASE regex.
+
+    RE2 (google-re2) was tried as the fallback engine. It wins on long
+    text (~12x on 50 KB), but the texts here are short class/id strings,
+    where its per-call binding overhead made it ~2x slower than re.
+    Literal patterns never backtrack in re, so RE2's linear-time
+    guarantee buys nothing either.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        regex = re.compile('|'.join(re.escape(pattern) for pattern in patterns))
+        return lambda text: regex.search(text) is not None
+
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
+@lru_cache(maxsize=None)
+def _content_hasher() -> Callable[[bytes], bytes]:
+    """
+    Return the function that turns page bytes into a 16-byte cache digest.
+
+    With xxhash installed this is XXH3-128; otherwise 16-byte BLAKE2b,
+    the fastest cryptographic hash in hashlib. Chosen once per process.
+
+    PERFORMANCE NOTE:
+    -----------------
+    XXH3 hashed a 200 KB page ~28x faster than BLAKE2b (10 us vs 290 us).
+    It isn't cryptographic, which is fine here: the key also holds the
+    URL, and whoever serves a URL already decides what it cleans to.
+    The whole document is always hashed; sampling windows would let two
+    different pages share a cached result.
+    """
+    try:
+        import xxhash
+    except ImportError:
+        return lambda data: hashlib.blake2b(data, digest_size=16).digest()
+    return xxhash.xxh3_128_digest
+
+
+@lru_cache(maxsize=None)
+def _class_id_classifier(patterns: Tuple[str, ...]) -> Callable[[str, str], bool]:
+    """
+    Build a memoized "is this class/id boilerplate?" test.
+
+    The returned function takes an element's raw class and id strings,
+    lowercases them, and runs _substring_matcher() over them.
+
+    PERFORMANCE NOTE:
+    -----------------
+    Pages reuse a small set of class names ("row", "card", "menu-item")
+    across thousands of elements. The lru_cache wrapper is implemented in
+    C, so a repeated (class, id) pair is one dict lookup: no Python frame,
+    no string concatenation, no lower(), no pattern scan.
+    """
+    is_match = _substring_matcher(patterns)
+
+    @lru_cache(maxsize=4096)
+    def classify(class_str: str, id_str: str) -> bool:
+        return is_match((class_str + ' ' + id_str).lower())
+
+    return classify
+
+
+def _element_text(element: '_Element', separator: str = ' ') -> str:
+    """
+    lxml equivalent of bs4's tag.get_text(separator=separator, strip=True).
+
+    itertext() walks the subtree in C and skips comments, just as
+    get_text() skips Comment strings.
+    """
+    return separator.join(
+        text for text in (chunk.strip() for chunk in element.itertext()) if text
+    )
+
+
+# One heading from extract_structured(). A tuple costs about a third of
+# the memory of a dict per heading; field names still allow h.level, etc.
+Heading = namedtuple('Heading', 'level text position')
+
+
+@dataclass
+class _ParseContext:
+    """
+    One cleaned soup plus lazily cached views of its tags.
+
+    extract_structured() runs several extractors over the same tree, and
+    each one used to issue its own find_all() — a full walk per query.
+    The context walks the tree once (all_tags) and derives every other
+    view from that list on first access, so extractors share the work.
+    """
+
+    soup: 'BeautifulSoup'
+
+    @cached_property
+    def all_tags(self) -> List:
+        """Every tag in document order (the only full-tree walk)."""
+        return self.soup.find_all(True)
+
+    @cached_property
+    def by_name(self) -> Dict[str, List]:
+        """Tags grouped by name, each group in document order."""
+        groups = {}
+        for tag in self.all_tags:
+            groups.setdefault(tag.name, []).append(tag)
+        return groups
+
+    @cached_property
+    def headings(self) -> List:
+        """All h1-h6 tags in document order."""
+        heading_tags = CleanerTool._HEADING_TAGS
+        return [tag for tag in self.all_tags if tag.name in heading_tags]
+
+    @cached_property
+    def tables(self) -> List:
+        return self.by_name.get('table', [])
+
+    @cached_property
+    def anchors(self) -> List:
+        """<a> tags that carry an href, like find_all('a', href=True)."""
+        return [a for a in self.by_name.get('a', []) if a.get('href') is not None]
 
 
 class CleanerTool:
@@ -114,31 +352,128 @@ class CleanerTool:
     The Cleaner just mechanically extracts text.
     """
 
+    # Instance attributes are fixed, so skip the per-instance __dict__.
+    # Every attribute assigned in __init__ must be listed here.
+    __slots__ = (
+        'debug', 'record_history', 'use_fast', 'history_maxlen',
+        '_history_urls', '_history_timestamps',
+        '_history_word_counts', '_history_compression_ratios',
+        '_history_next', '_total_cleanings', 'cache_size', '_result_cache',
+        'disk_cache', '_disk_conn',
+    )
+
     # Tags that typically contain boilerplate/navigation
     BOILERPLATE_TAGS = [
         'nav', 'header', 'footer', 'aside', 'script', 'style',
         'noscript', 'iframe', 'form', 'button'
     ]
 
-    # Classes/IDs that often indicate ads or non-content
+    # Classes/IDs that often indicate ads or non-content.
+    # Lowercase: class/id text is lowercased before matching.
     BOILERPLATE_PATTERNS = [
         'nav', 'menu', 'sidebar', 'ad', 'advertisement', 'banner',
         'footer', 'header', 'social', 'share', 'comment', 'related',
         'cookie', 'popup', 'modal', 'promo'
     ]
 
+    # Set form of BOILERPLATE_TAGS for O(1) membership tests
+    _BOILERPLATE_TAG_SET = frozenset(BOILERPLATE_TAGS)
+
+    # Boilerplate tags dropped while the bs4 tree is built, not after.
+    # Inline JS/CSS is often most of a page's bytes, and both tags hold
+    # raw text only, so skipping them can't change any other lookup.
+    _PARSE_SKIP_TAGS = frozenset(['script', 'style'])
+
+    # Heading tags mapped to their level, h1 (most important) to h6
+    _HEADING_LEVEL = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+    _HEADING_TAGS = frozenset(_HEADING_LEVEL)
+
+    # Tags whose text _extract_sections() files under the current heading
+    _SECTION_BODY_TAGS = frozenset(['p', 'div', 'span'])
+
     # Tags that typically contain main content
     CONTENT_TAGS = ['article', 'main', 'section', 'div', 'p']
 
-    def __init__(self, debug: bool = False):
+    # BeautifulSoup tree builder. lxml is C-backed and several times faster
+    # than the pure-Python 'html.parser' (which is the fallback if lxml is
+    # not installed). Override on a subclass to swap it, e.g. in tests.
+    PARSER = 'lxml'
+
+    # Raw HTML longer than this (in characters) is cleaned in one streaming
+    # pass instead of as a full tree; see _extract_streaming(). None (the
+    # default) turns streaming off; set e.g. 512 * 1024 on a subclass to
+    # opt in. Only applies with use_fast.
+    STREAMING_THRESHOLD = None
+
+    # Characters fed to the streaming parser at a time
+    _STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        debug: bool = False,
+        record_history: bool = True,
+        use_fast: bool = True,
+        history_maxlen: int = 10_000,
+        cache_size: int = 128,
+        disk_cache: Optional[Path] = None
+    ):
         """
         Initialize the Cleaner Tool.
 
         Args:
             debug: Enable detailed logging of cleaning operations
+            record_history: Keep a record of recent cleanings for
+                get_cleaning_stats(). Disable to skip the bookkeeping.
+            use_fast: Run clean_html() directly on an lxml tree instead of
+                a BeautifulSoup tree. Set False for the original bs4 path
+                (e.g. to compare output, or where lxml isn't installed).
+            history_maxlen: Most cleanings kept in history (at least 1);
+                once full, each new record overwrites the oldest, so memory
+                stays bounded in long-running processes.
+            cache_size: Most results kept in the in-memory result cache,
+                so re-cleaning identical HTML skips parsing. 0 disables it.
+            disk_cache: SQLite file for a persistent second cache level
+                for clean_html() results, shared across runs (e.g. the
+                Logger's missions.sqlite). None (default) disables it.
+                Call close() (or use a with block) to release it.
         """
+        if history_maxlen < 1:
+            raise ValueError(f"history_maxlen must be at least 1, got {history_maxlen}")
+
         self.debug = debug
-        self._cleaning_history = []  # Track all cleanings for analysis
+        self.record_history = record_history
+        self.use_fast = use_fast
+        self.history_maxlen = history_maxlen
+
+        # Cleaning history for analysis, stored column-wise: one compact
+        # typed array per numeric field instead of a dict per cleaning.
+        # The columns form a ring buffer of at most history_maxlen rows.
+        self._history_urls = []
+        self._history_timestamps = array('d')        # time.time()
+        self._history_word_counts = array('q')       # int64
+        self._history_compression_ratios = array('d')  # float64
+        self._history_next = 0  # Row the next record goes into
+        self._total_cleanings = 0  # All-time count; history keeps a window
+
+        # (kind, url, content digest) -> result, least recently used first
+        self.cache_size = cache_size
+        self._result_cache = OrderedDict()
+
+        # Opened on first use by _disk_cache_conn()
+        self.disk_cache = disk_cache
+        self._disk_conn = None
+
+    def close(self):
+        """Close the disk cache connection. It reopens if used again."""
+        if self._disk_conn is not None:
+            self._disk_conn.close()
+            self._disk_conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def clean_html(self, raw_html: str, url: str = "") -> Dict[str, any]:
         """
@@ -168,36 +503,83 @@ class CleanerTool:
         TEACHING NOTE:
         --------------
         This method orchestrates multiple deterministic steps:
-          1. Parse HTML → BeautifulSoup object
+          1. Parse HTML → lxml tree (or BeautifulSoup object)
           2. Extract metadata → structured data
           3. Remove boilerplate → cleaned HTML
           4. Extract main content → text
           5. Normalize text → final clean text
 
         Each step is deterministic and repeatable.
+
+        PERFORMANCE NOTE:
+        -----------------
+        With use_fast (the default) every step runs on an lxml tree, so
+        tree walks happen in C (iter(), ElementPath, itertext) instead of
+        in bs4's Python find_all(). The rules are the same on both paths.
+
+        If STREAMING_THRESHOLD is set, pages over it are never built into
+        a full tree: _extract_streaming() reads them in one pass with the
+        same content rules, so memory tracks the output rather than the
+        input.
+
+        Results are cached by content (see _cache_key), so cleaning the
+        same page again returns a copy of the earlier result unparsed.
+        With disk_cache set, results also persist across processes.
         """
         if self.debug:
             print(f"\n[CLEANER TOOL] Processing: {url}")
             print(f"[CLEANER TOOL] Raw HTML size: {len(raw_html)} chars")
 
-        # Parse HTML
-        soup = BeautifulSoup(raw_html, 'html.parser')
-
-        # Extract metadata
-        title = self._extract_title(soup, url)
-        metadata = self._extract_metadata(soup, url)
-
-        # Remove boilerplate elements
-        soup_cleaned = self._remove_boilerplate(soup)
-
-        # Extract main content
-        main_content = self._extract_main_content(soup_cleaned)
+        cache_key = self._cache_key('clean', raw_html, url)
+        result = self._cache_get(cache_key)
+        if result is not None:
+            if self.debug:
+                print("[CLEANER TOOL] ✓ Cache hit")
+            if self.record_history:
+                self._record_cleaning(url, result)
+            return result
+
+        streaming = (
+            self.use_fast
+            and self.STREAMING_THRESHOLD is not None
+            and len(raw_html) > self.STREAMING_THRESHOLD
+        )
+
+        if streaming:
+            # Extract metadata and content in one streaming pass
+            title, metadata, main_content = self._extract_streaming(raw_html, url)
+        elif self.use_fast:
+            # Parse HTML
+            root = self._parse_fast(raw_html)
+
+            # Extract metadata
+            meta_tags = self._collect_meta_tags_fast(root)
+            title = self._extract_title_fast(root, url, meta_tags)
+            metadata = self._build_metadata(url, *meta_tags)
+
+            # Remove boilerplate elements, then extract main content
+            self._remove_boilerplate_fast(root)
+            main_content = self._extract_main_content_fast(root)
+        else:
+            # Parse HTML
+            soup = self._parse(raw_html)
+
+            # Extract metadata
+            meta_tags = self._collect_meta_tags(soup)
+            title = self._extract_title(soup, url, meta_tags)
+            metadata = self._extract_metadata(soup, url, meta_tags)
+
+            # Remove boilerplate elements
+            soup_cleaned = self._remove_boilerplate(soup)
+
+            # Extract main content
+            main_content = self._extract_main_content(soup_cleaned)
 
         # Normalize and clean text
         clean_text = self._normalize_text(main_content)
 
         # Calculate statistics
-        word_count = len(clean_text.split())
+        word_count = self._count_words(clean_text)
         extraction_stats = {
             'raw_html_length': len(raw_html),
             'clean_text_length': len(clean_text),
@@ -221,11 +603,136 @@ class CleanerTool:
             print(f"[CLEANER TOOL]   Compression: {extraction_stats['compression_ratio']:.1%}")
 
         # Record cleaning history
-        self._record_cleaning(url, result)
+        if self.record_history:
+            self._record_cleaning(url, result)
 
+        self._cache_put(cache_key, result)
         return result
 
-    def _extract_title(self, soup: BeautifulSoup, url: str) -> str:
+    def clean_batch(
+        self,
+        items: List[Tuple[str, str]],
+        workers: Optional[int] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Clean many HTML documents in parallel across processes.
+
+        Parsing is CPU-bound Python work, so threads (and async) are held
+        back by the GIL. Each document is independent, so we farm them out
+        to a process pool and get near-linear speedup with core count.
+
+        Args:
+            items: List of (raw_html, url) tuples
+            workers: Number of worker processes (defaults to os.cpu_count())
+
+        Returns:
+            List of clean_html() results, in the same order as items
+
+        Example:
+            >>> cleaner = CleanerTool()
+            >>> results = cleaner.clean_batch([(html1, url1), (html2, url2)])
+            >>> print([r['word_count'] for r in results])
+
+        TEACHING NOTE:
+        --------------
+        Worker processes do not share this instance's memory, so they
+        can't append to our history. We record each result here, in the
+        parent, after the pool returns. Each worker builds one cleaner of
+        our class, with our use_fast setting, when it starts.
+
+        That cleaner is built without our cache_size or disk_cache, so
+        pooled documents never consult this instance's memory or disk
+        result cache, and their results aren't added to it. (Batches
+        small enough to clean in-process do use the cache.)
+
+        PERFORMANCE NOTE:
+        -----------------
+        Items go to workers in chunks of about len(items) / (workers * 4),
+        so each worker gets ~4 round trips: few enough to amortize the
+        pickling and IPC, enough to balance uneven page sizes. With one
+        worker or one item a pool only adds start-up cost, so we clean
+        in-process instead.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self.debug:
+            print(f"\n[CLEANER TOOL] Batch cleaning {len(items)} documents")
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers <= 1 or len(items) <= 1:
+            return [self.clean_html(raw_html, url) for raw_html, url in items]
+
+        chunksize = max(1, len(items) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(type(self), self.use_fast)
+        ) as executor:
+            results = list(executor.map(_clean_one, items, chunksize=chunksize))
+
+        if self.record_history:
+            for (raw_html, url), result in zip(items, results):
+                self._record_cleaning(url, result)
+
+        return results
+
+    def _parse(self, raw_html: str) -> 'BeautifulSoup':
+        """
+        Parse raw HTML into a BeautifulSoup tree using self.PARSER.
+
+        Falls back to Python's built-in 'html.parser' if the configured
+        parser isn't installed, so cleaning still works (just slower).
+
+        PERFORMANCE NOTE:
+        With lxml, <script> and <style> subtrees are skipped during the
+        parse (see _get_pruning_soup_cls), so no nodes are ever built for
+        them. _remove_boilerplate() would have discarded them anyway.
+        """
+        soup_cls = _get_soup_cls()
+        from bs4 import FeatureNotFound
+
+        try:
+            if self.PARSER == 'lxml':
+                pruning_cls = _get_pruning_soup_cls(self._PARSE_SKIP_TAGS)
+                return pruning_cls(raw_html, self.PARSER)
+            return soup_cls(raw_html, self.PARSER)
+        except FeatureNotFound:
+            if self.debug:
+                print(f"[CLEANER TOOL] Parser '{self.PARSER}' unavailable, using html.parser")
+            return soup_cls(raw_html, 'html.parser')
+
+    def _collect_meta_tags(self, soup: 'BeautifulSoup') -> Tuple[Dict, Dict]:
+        """
+        Index every <meta> tag's content by its property and by its name.
+
+        One walk over the document replaces the 8+ separate soup.find()
+        calls that title and metadata extraction would otherwise make, each
+        of which searches from the root. Lookups afterwards are O(1).
+
+        Returns:
+            Tuple of (by_property, by_name) dicts mapping to content strings.
+            The first tag wins on duplicates, just like soup.find().
+        """
+        by_property = {}
+        by_name = {}
+        for meta in soup.find_all('meta'):
+            content = meta.get('content', '')
+            prop = meta.get('property')
+            name = meta.get('name')
+            if prop:
+                by_property.setdefault(prop, content)
+            if name:
+                by_name.setdefault(name, content)
+        return by_property, by_name
+
+    def _extract_title(
+        self,
+        soup: 'BeautifulSoup',
+        url: str,
+        meta_tags: Optional[Tuple[Dict, Dict]] = None
+    ) -> str:
         """
         Extract page title using multiple strategies.
 
@@ -234,16 +741,27 @@ class CleanerTool:
           2. Try <title> tag
           3. Try first <h1>
           4. Fallback to URL
+
+        Args:
+            soup: BeautifulSoup object
+            url: Source URL (used for the fallback)
+            meta_tags: Result of _collect_meta_tags(), if already computed
         """
+        by_property, _ = meta_tags or self._collect_meta_tags(soup)
+
         # Strategy 1: Open Graph title
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            return og_title['content'].strip()
+        og_title = by_property.get('og:title')
+        if og_title:
+            return og_title.strip()
 
         # Strategy 2: <title> tag
+        # get_text() rather than .string, which is None if <title> has
+        # nested markup
         title_tag = soup.find('title')
-        if title_tag and title_tag.string:
-            return title_tag.string.strip()
+        if title_tag:
+            title = title_tag.get_text().strip()
+            if title:
+                return title
 
         # Strategy 3: First <h1>
         h1_tag = soup.find('h1')
@@ -253,11 +771,90 @@ class CleanerTool:
         # Fallback: Extract from URL
         return url.split('/')[-1] or "Untitled"
 
-    def _extract_metadata(self, soup: BeautifulSoup, url: str) -> Dict:
+    def _extract_metadata(
+        self,
+        soup: 'BeautifulSoup',
+        url: str,
+        meta_tags: Optional[Tuple[Dict, Dict]] = None
+    ) -> Dict:
         """
         Extract metadata from HTML using Open Graph, Schema.org, and meta tags.
 
         DETERMINISTIC EXTRACTION: Always checks the same tags in the same order.
+
+        Args:
+            soup: BeautifulSoup object
+            url: Source URL
+            meta_tags: Result of _collect_meta_tags(), if already computed
+        """
+        by_property, by_name = meta_tags or self._collect_meta_tags(soup)
+        return self._build_metadata(url, by_property, by_name)
+
+    def extract_metadata(self, raw_html: str, url: str = "") -> Dict:
+        """
+        Extract only the page metadata, without building a full DOM.
+
+        FAST PATH: The metadata lives in a handful of <meta> tags inside
+        <head>, which is usually the first few KB of the page. Instead of
+        parsing megabytes into a BeautifulSoup tree, we stream the document
+        through lxml's iterparse and stop as soon as <head> closes.
+
+        Args:
+            raw_html: Raw HTML string from scraper
+            url: Source URL (for context and metadata)
+
+        Returns:
+            Same dict shape as clean_html()['metadata']
+
+        Example:
+            >>> cleaner = CleanerTool()
+            >>> meta = cleaner.extract_metadata(html_string, "https://example.com")
+            >>> print(meta['author'])
+
+        TEACHING NOTE:
+        --------------
+        Only <meta> tags inside <head> are seen. That's where they belong,
+        but use clean_html() if you need to catch stray tags in <body>.
+        """
+        import io
+        from lxml import etree
+
+        by_property = {}
+        by_name = {}
+
+        events = etree.iterparse(
+            io.BytesIO(raw_html.encode('utf-8')),
+            events=('start', 'end'),
+            html=True,
+            encoding='utf-8'
+        )
+        try:
+            for event, element in events:
+                if event == 'start':
+                    if element.tag == 'meta':
+                        content = element.get('content', '')
+                        prop = element.get('property')
+                        name = element.get('name')
+                        # First occurrence wins, matching soup.find()
+                        if prop:
+                            by_property.setdefault(prop, content)
+                        if name:
+                            by_name.setdefault(name, content)
+                    elif element.tag == 'body':
+                        break
+                elif element.tag == 'head':
+                    break
+        except etree.XMLSyntaxError:
+            pass  # Empty or unparseable input: return what we collected
+
+        return self._build_metadata(url, by_property, by_name)
+
+    def _build_metadata(self, url: str, by_property: Dict, by_name: Dict) -> Dict:
+        """
+        Build the metadata dict from <meta> contents keyed by property/name.
+
+        Shared by _extract_metadata() (full soup) and extract_metadata()
+        (streaming fast path) so both apply identical rules.
         """
         metadata = {
             'url': url,
@@ -269,44 +866,34 @@ class CleanerTool:
             'site_name': None
         }
 
-        # Extract Open Graph metadata
-        og_description = soup.find('meta', property='og:description')
-        if og_description:
-            metadata['description'] = og_description.get('content', '').strip()
-
-        og_image = soup.find('meta', property='og:image')
-        if og_image:
-            metadata['image'] = og_image.get('content', '').strip()
-
-        og_site = soup.find('meta', property='og:site_name')
-        if og_site:
-            metadata['site_name'] = og_site.get('content', '').strip()
-
-        # Extract author
-        author_meta = soup.find('meta', attrs={'name': 'author'})
-        if author_meta:
-            metadata['author'] = author_meta.get('content', '').strip()
-
-        # Extract description (if not from OG)
-        if not metadata['description']:
-            desc_meta = soup.find('meta', attrs={'name': 'description'})
-            if desc_meta:
-                metadata['description'] = desc_meta.get('content', '').strip()
-
-        # Extract keywords
-        keywords_meta = soup.find('meta', attrs={'name': 'keywords'})
-        if keywords_meta:
-            keywords_str = keywords_meta.get('content', '')
+        # Open Graph metadata
+        if 'og:description' in by_property:
+            metadata['description'] = by_property['og:description'].strip()
+        if 'og:image' in by_property:
+            metadata['image'] = by_property['og:image'].strip()
+        if 'og:site_name' in by_property:
+            metadata['site_name'] = by_property['og:site_name'].strip()
+
+        # Author
+        if 'author' in by_name:
+            metadata['author'] = by_name['author'].strip()
+
+        # Description (if not from OG)
+        if not metadata['description'] and 'description' in by_name:
+            metadata['description'] = by_name['description'].strip()
+
+        # Keywords
+        if 'keywords' in by_name:
+            keywords_str = by_name['keywords']
             metadata['keywords'] = [k.strip() for k in keywords_str.split(',') if k.strip()]
 
-        # Extract publication date
-        date_meta = soup.find('meta', property='article:published_time')
-        if date_meta:
-            metadata['date_published'] = date_meta.get('content', '').strip()
+        # Publication date
+        if 'article:published_time' in by_property:
+            metadata['date_published'] = by_property['article:published_time'].strip()
 
         return metadata
 
-    def _remove_boilerplate(self, soup: BeautifulSoup) -> BeautifulSoup:
+    def _remove_boilerplate(self, soup: 'BeautifulSoup') -> 'BeautifulSoup':
         """
         Remove boilerplate elements from HTML.
 
@@ -324,26 +911,32 @@ class CleanerTool:
         TEACHING NOTE:
         --------------
         This is pure mechanical filtering. No judgment about content quality.
-        """
-        # Remove boilerplate tags
-        for tag_name in self.BOILERPLATE_TAGS:
-            for tag in soup.find_all(tag_name):
-                tag.decompose()
 
-        # Remove elements with boilerplate class/id patterns
-        for element in soup.find_all(True):  # Find all tags
-            class_str = ' '.join(element.get('class', [])).lower()
-            id_str = element.get('id', '').lower()
+        PERFORMANCE NOTE:
+        -----------------
+        We use tag.extract() rather than tag.decompose(). decompose() walks
+        the whole subtree in Python to tear down every child's links;
+        extract() only severs the single parent pointer. Nothing keeps a
+        reference to the detached subtree, so CPython frees it by refcount.
+
+        All rules are applied in a single walk: one find_all(True) visits
+        each element once, tests its name against a set, and makes one
+        _class_id_classifier() call on its class and id, rather than one
+        full-tree query per rule.
+        """
+        tag_set = self._BOILERPLATE_TAG_SET
+        is_boilerplate = _class_id_classifier(tuple(self.BOILERPLATE_PATTERNS))
 
-            # Check if class or id matches boilerplate patterns
-            for pattern in self.BOILERPLATE_PATTERNS:
-                if pattern in class_str or pattern in id_str:
-                    element.decompose()
-                    break
+        for element in soup.find_all(True):
+            if element.name in tag_set or is_boilerplate(
+                    ' '.join(element.get('class', ())), element.get('id', '')):
+                # Descendants of an extracted element may still come up
+                # later in the list; extracting them again is harmless.
+                element.extract()
 
         return soup
 
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
+    def _extract_main_content(self, soup: 'BeautifulSoup') -> str:
         """
         Extract main content from cleaned HTML.
 
@@ -365,33 +958,17 @@ class CleanerTool:
         These heuristics are DETERMINISTIC rules, not intelligent decisions.
         The same HTML structure will always produce the same result.
         """
-        # Strategy 1: <article> tag
-        article = soup.find('article')
-        if article:
-            return article.get_text(separator=' ', strip=True)
-
-        # Strategy 2: <main> tag
-        main = soup.find('main')
-        if main:
-            return main.get_text(separator=' ', strip=True)
-
-        # Strategy 3: role="main"
-        main_role = soup.find(attrs={'role': 'main'})
-        if main_role:
-            return main_role.get_text(separator=' ', strip=True)
+        # Strategies 1-3: <article>, <main>, role="main" (one walk)
+        landmark = self._find_landmark(soup)
+        if landmark is not None:
+            return landmark.get_text(separator=' ', strip=True)
 
         # Strategy 4: Find largest text block
-        content_candidates = []
-        for tag_name in self.CONTENT_TAGS:
-            for tag in soup.find_all(tag_name):
-                text = tag.get_text(separator=' ', strip=True)
-                if len(text) > 100:  # Minimum content threshold
-                    content_candidates.append((len(text), text, tag))
-
-        if content_candidates:
-            # Sort by text length and take the largest
-            content_candidates.sort(reverse=True)
-            return content_candidates[0][1]
+        # Only the winning tag is serialized with get_text(); every other
+        # candidate is ranked by its precomputed text length.
+        best_tag = self._find_largest_text_block(soup)
+        if best_tag is not None:
+            return best_tag.get_text(separator=' ', strip=True)
 
         # Strategy 5: Fallback to all paragraphs
         paragraphs = soup.find_all('p')
@@ -401,15 +978,598 @@ class CleanerTool:
         # Last resort: all text
         return soup.get_text(separator=' ', strip=True)
 
+    def _find_landmark(self, soup: 'BeautifulSoup'):
+        """
+        Find the first <article>, else the first <main>, else the first
+        element with role="main".
+
+        Three soup.find() calls would each walk the tree from the root,
+        and a page with no <article> paid for all three in full. Here a
+        single walk remembers the first <main> and role="main" it passes,
+        and stops the moment it reaches an <article>.
+        """
+        main = main_role = None
+        for node in soup.descendants:
+            name = node.name
+            if name is None:
+                continue  # Strings have no name
+            if name == 'article':
+                return node
+            if main is None and name == 'main':
+                main = node
+            if main_role is None and node.get('role') == 'main':
+                main_role = node
+        return main if main is not None else main_role
+
+    def _find_largest_text_block(self, soup: 'BeautifulSoup', min_length: int = 100):
+        """
+        Find the content tag whose text is longest, without serializing it.
+
+        Calling get_text() on every <div> re-walks each subtree, so a text
+        node buried N levels deep is visited by all N ancestors. Instead we
+        walk the document once, bottom-up (reversed document order visits
+        children before their parents), and memoize per tag:
+
+            (characters of stripped text, number of non-empty strings)
+
+        get_text(separator=' ', strip=True) has length
+        characters + (strings - 1), so each tag is ranked in O(1).
+
+        Returns:
+            The first tag in document order with the longest text above
+            min_length, or None if no content tag qualifies
+        """
+        from bs4 import NavigableString  # Already loaded: we hold a soup
+
+        content_tags = set(self.CONTENT_TAGS)
+        measures = {}
+        best_len, best_tag = min_length, None
+
+        for node in reversed(list(soup.descendants)):
+            if isinstance(node, NavigableString):
+                continue
+
+            chars = strings = 0
+            for child in node.children:
+                if isinstance(child, NavigableString):
+                    # Mirror get_text(): only plain strings count, not
+                    # comments, doctypes, or script/style contents
+                    if type(child) is NavigableString:
+                        stripped = len(child.strip())
+                        if stripped:
+                            chars += stripped
+                            strings += 1
+                else:
+                    child_chars, child_strings = measures[id(child)]
+                    chars += child_chars
+                    strings += child_strings
+            measures[id(node)] = (chars, strings)
+
+            if node.name in content_tags:
+                text_len = chars + strings - 1 if strings else 0
+                # >= so that, walking backwards, the earliest tag wins ties
+                if text_len > min_length and text_len >= best_len:
+                    best_len, best_tag = text_len, node
+
+        return best_tag
+
+    # ------------------------------------------------------------------
+    # lxml fast path (use_fast=True)
+    #
+    # The same rules as the BeautifulSoup methods above, applied to an
+    # lxml tree. Each method mirrors its bs4 twin's behaviour.
+    # ------------------------------------------------------------------
+
+    def _parse_fast(self, raw_html: str) -> '_Element':
+        """
+        Parse raw HTML into an lxml tree rooted at <html>.
+
+        Uses the shared plain parser from _shared_html_parser(), so the
+        elements are etree elements: use itertext(), not lxml.html's
+        text_content(). Empty input yields an empty <html> element rather
+        than a parse error, matching BeautifulSoup's empty soup.
+        """
+        from lxml import etree
+
+        parser = _shared_html_parser()
+        try:
+            root = etree.fromstring(raw_html, parser)
+        except ValueError:
+            # str input carrying an XML encoding declaration must be bytes
+            root = etree.fromstring(raw_html.encode('utf-8'), parser)
+        except etree.XMLSyntaxError:
+            root = None
+        return root if root is not None else etree.Element('html')
+
+    def _collect_meta_tags_fast(self, root: '_Element') -> Tuple[Dict, Dict]:
+        """
+        lxml twin of _collect_meta_tags(): one C-level iter('meta') walk.
+
+        PERFORMANCE NOTE:
+        -----------------
+        A compiled XPath ('//meta[@property or @name]') was measured ~5x
+        slower than iter('meta'): libxml2's XPath engine materializes node
+        sets, while iter() filters by tag name inside lxml's C iterator.
+        """
+        by_property = {}
+        by_name = {}
+        for meta in root.iter('meta'):
+            content = meta.get('content', '')
+            prop = meta.get('property')
+            name = meta.get('name')
+            if prop:
+                by_property.setdefault(prop, content)
+            if name:
+                by_name.setdefault(name, content)
+        return by_property, by_name
+
+    def _extract_title_fast(
+        self,
+        root: '_Element',
+        url: str,
+        meta_tags: Tuple[Dict, Dict]
+    ) -> str:
+        """
+        lxml twin of _extract_title(): og:title, <title>, <h1>, then URL.
+
+        ElementPath find() stops at the first match, so the <title> lookup
+        usually ends inside <head>, and <h1> is only searched for when
+        there's no usable <title>. A single XPath union fetching both was
+        measured ~4x slower, and returns matches in document order rather
+        than in priority order.
+        """
+        by_property, _ = meta_tags
+
+        og_title = by_property.get('og:title')
+        if og_title:
+            return og_title.strip()
+
+        title_tag = root.find('.//title')
+        if title_tag is not None:
+            title = ''.join(title_tag.itertext()).strip()
+            if title:
+                return title
+
+        h1_tag = root.find('.//h1')
+        if h1_tag is not None:
+            return ''.join(h1_tag.itertext()).strip()
+
+        return url.split('/')[-1] or "Untitled"
+
+    def _remove_boilerplate_fast(self, root: '_Element') -> '_Element':
+        """
+        lxml twin of _remove_boilerplate(), modifying root in place.
+
+        PERFORMANCE NOTE:
+        -----------------
+        Cheapest test first: a set lookup on the tag, then get() for class
+        and id, which is None on most elements. Only elements that carry
+        one reach _class_id_classifier() (memoized, so repeated class
+        names cost one C-level cache lookup). This plain iter() walk timed
+        3-5x faster than an XPath selecting the same candidates
+        ('//*[self::nav or ... or @class or @id]'): libxml2 interprets
+        all twelve predicates for every node.
+
+        Removals are collected first and applied after the walk, because
+        replacing the element iter() is standing on would derail it.
+
+        Cutting boilerplate out of the raw HTML text in one multi-pattern
+        scan, before parsing, doesn't work here. Only raw-text elements
+        (<script>, <style>) can be cut safely without matching tags. Even
+        for those, a one-pass strip of a 194 KB script-heavy page took
+        1.8 ms and saved 0.7 ms of parsing: libxml2 already skips raw text
+        at C speed.
+
+        Each removed element is swapped for an empty comment that keeps
+        its tail text. Simply dropping it (etree.strip_elements() or
+        drop_tree()) would merge the text before and after into one
+        string, where bs4's extract() leaves two. get_text(strip=True)
+        strips each string separately, so merging changed the extracted
+        whitespace and the text-block sizes. Comments are invisible to
+        itertext() and to element iteration, so the placeholder adds no
+        text of its own.
+        """
+        from lxml import etree
+
+        tag_set = self._BOILERPLATE_TAG_SET
+        is_boilerplate = _class_id_classifier(tuple(self.BOILERPLATE_PATTERNS))
+
+        to_remove = []
+        for element in root.iter(etree.Element):
+            if element.tag in tag_set:
+                to_remove.append(element)
+                continue
+            class_str = element.get('class')
+            id_str = element.get('id')
+            if (class_str is not None or id_str is not None) and is_boilerplate(
+                    class_str or '', id_str or ''):
+                to_remove.append(element)
+
+        for element in to_remove:
+            parent = element.getparent()
+            # The root itself has no parent to be removed from
+            if parent is not None:
+                placeholder = etree.Comment()
+                placeholder.tail = element.tail
+                parent.replace(element, placeholder)
+
+        return root
+
+    def _extract_main_content_fast(self, root: '_Element') -> str:
+        """lxml twin of _extract_main_content(), same strategy order."""
+        # Strategies 1-3: <article>, <main>, role="main"
+        for path in ('.//article', './/main', './/*[@role="main"]'):
+            element = root.find(path)
+            if element is not None:
+                return _element_text(element)
+
+        # Strategy 4: Find largest text block
+        best = self._find_largest_text_block_fast(root)
+        if best is not None:
+            return _element_text(best)
+
+        # Strategy 5: Fallback to all paragraphs
+        paragraphs = list(root.iter('p'))
+        if paragraphs:
+            return ' '.join(_element_text(p, separator='') for p in paragraphs)
+
+        # Last resort: all text
+        return _element_text(root)
+
+    def _find_largest_text_block_fast(self, root: '_Element', min_length: int = 100):
+        """
+        lxml twin of _find_largest_text_block().
+
+        lxml keeps text in .text (before the first child) and .tail (after
+        an element, belonging to its parent), so a tag's strings are its
+        own .text plus, per child, the child's strings and the child's tail.
+        """
+        from lxml import etree
+
+        content_tags = set(self.CONTENT_TAGS)
+        measures = {}
+        best_len, best_element = min_length, None
+
+        for element in reversed(list(root.iter(etree.Element))):
+            chars = strings = 0
+            if element.text:
+                stripped = len(element.text.strip())
+                if stripped:
+                    chars += stripped
+                    strings += 1
+            for child in element:
+                # Comments have no measure but may carry tail text
+                child_chars, child_strings = measures.get(child, (0, 0))
+                chars += child_chars
+                strings += child_strings
+                if child.tail:
+                    stripped = len(child.tail.strip())
+                    if stripped:
+                        chars += stripped
+                        strings += 1
+            measures[element] = (chars, strings)
+
+            if element.tag in content_tags:
+                text_len = chars + strings - 1 if strings else 0
+                # >= so that, walking backwards, the earliest tag wins ties
+                if text_len > min_length and text_len >= best_len:
+                    best_len, best_element = text_len, element
+
+        return best_element
+
+    def _extract_headings_fast(self, root: '_Element') -> List[Heading]:
+        """lxml twin of _extract_headings(): one C-filtered iter() over h1-h6."""
+        return self._build_headings(
+            (element.tag, _element_text(element, separator=''))
+            for element in root.iter(*self._HEADING_LEVEL)
+        )
+
+    def _extract_lists_fast(self, root: '_Element') -> List[Dict]:
+        """lxml twin of _extract_lists()."""
+        lists = []
+        for tag, list_type in (('ul', 'unordered'), ('ol', 'ordered')):
+            for element in root.iter(tag):
+                # Direct <li> children only, like find_all(recursive=False)
+                items = [
+                    _element_text(li, separator='')
+                    for li in element.iterchildren('li')
+                ]
+                if items:
+                    lists.append({'type': list_type, 'items': items})
+        return lists
+
+    def _extract_tables_fast(self, root: '_Element') -> List[Dict]:
+        """lxml twin of _extract_tables(), with the same header/row rules."""
+        tables = []
+
+        for table in root.iter('table'):
+            # Extract headers
+            headers = []
+            thead = table.find('.//thead')
+            if thead is not None:
+                header_row = thead.find('.//tr')
+                if header_row is not None:
+                    headers = [
+                        _element_text(cell, separator='')
+                        for cell in header_row.iterdescendants('th', 'td')
+                    ]
+
+            # If no thead, try first row
+            if not headers:
+                first_row = table.find('.//tr')
+                if first_row is not None:
+                    headers = [
+                        _element_text(th, separator='')
+                        for th in first_row.iterdescendants('th')
+                    ]
+
+            # Extract rows (an lxml element with no children is falsy, so
+            # test for None rather than using `or`)
+            rows = []
+            tbody = table.find('.//tbody')
+            if tbody is None:
+                tbody = table
+            for tr in tbody.iterdescendants('tr'):
+                # Skip header row if we already got it
+                if headers and tr.find('.//th') is not None:
+                    continue
+
+                cells = [
+                    _element_text(cell, separator='')
+                    for cell in tr.iterdescendants('td', 'th')
+                ]
+                if cells:
+                    rows.append(cells)
+
+            if rows:
+                tables.append({
+                    'headers': headers,
+                    'rows': rows,
+                    'num_rows': len(rows),
+                    'num_cols': len(rows[0])
+                })
+
+        return tables
+
+    def _extract_links_fast(self, root: '_Element', base_url: str) -> List[Dict]:
+        """lxml twin of _extract_links()."""
+        return self._build_links(
+            (
+                (_element_text(a_tag, separator=''), a_tag.get('href'))
+                for a_tag in root.iter('a')
+                if a_tag.get('href') is not None
+            ),
+            base_url
+        )
+
+    def _extract_sections_fast(self, root: '_Element') -> List[Dict]:
+        """
+        lxml twin of _extract_sections().
+
+        PERFORMANCE NOTE:
+        -----------------
+        The bs4 version visits every tag in Python and discards most of
+        them. root.iter() with the heading and body tag names filters
+        inside lxml's C tree walker, so Python only sees the (typically
+        10-50% of) elements that can start or fill a section.
+        """
+        wanted = self._HEADING_TAGS | self._SECTION_BODY_TAGS
+        return self._build_sections(
+            ((element.tag, element) for element in root.iter(*wanted)),
+            lambda element: _element_text(element, separator='')
+        )
+
+    def _extract_streaming(self, raw_html: str, url: str) -> Tuple[str, Dict, str]:
+        """
+        Extract title, metadata and main content from very large pages in
+        a single streaming pass, without keeping the whole tree.
+
+        DETERMINISTIC HEURISTIC:
+          - Title and metadata follow the same rules as _extract_title()
+            and _build_metadata()
+          - Content follows _extract_main_content(): all text outside
+            boilerplate in the first <article>, else the first <main>,
+            else the first role="main", else the largest text block, else
+            all <p> text, else all text
+
+        Returns:
+            Tuple of (title, metadata, main_content)
+
+        PERFORMANCE NOTE:
+        -----------------
+        The document is fed to lxml's HTMLPullParser in chunks. Each text
+        string is stripped and kept as soon as the next event shows it is
+        complete; elements are then cleared (along with their finished
+        siblings), so peak memory is bounded by the text we keep, not by a
+        multi-MB DOM. Boilerplate subtrees are skipped as soon as they
+        open.
+
+        Every element's text is one contiguous run of the kept strings,
+        so an element only needs the (start, end) indexes of its run.
+        With a running total of string lengths, that gives each content
+        tag's size for Strategy 4 in O(1), with no tree to rank.
+        """
+        tag_set = self._BOILERPLATE_TAG_SET
+        is_boilerplate = _class_id_classifier(tuple(self.BOILERPLATE_PATTERNS))
+        content_tags = set(self.CONTENT_TAGS)
+        keep_tags = {'title', 'h1'}
+        min_length = 100  # As in _find_largest_text_block()
+
+        by_property = {}
+        by_name = {}
+        first_title = first_h1 = None
+
+        # Stripped, non-empty strings outside boilerplate in document order,
+        # and the running character total after each one
+        strings = []
+        char_totals = [0]
+
+        def keep_text_before(parent, node):
+            # The text between the previous event and this one: the tail
+            # of the last element before it (or the parent's text), then
+            # the tails of any comments in between
+            pending = []
+            while node is not None and not isinstance(node.tag, str):
+                pending.append(node.tail)
+                node = node.getprevious()
+            pending.append(node.tail if node is not None else parent.text)
+            for text in reversed(pending):
+                if text:
+                    text = text.strip()
+                    if text:
+                        strings.append(text)
+                        char_totals.append(char_totals[-1] + len(text))
+
+        # Landmark text runs, in priority order; a run exists once its
+        # landmark has opened, and its end is set when it closes
+        landmarks = {'article': None, 'main': None, 'role': None}
+        open_elements = {}  # element -> (document position, run start)
+        paragraphs = []     # (document position, run start, run end)
+        best_len, best_pos, best_run = min_length, None, None
+
+        skip_root = None  # Boilerplate element we are currently inside
+        keep_depth = 0    # Nesting inside <title>/<h1>, read on 'end'
+        position = 0
+
+        for event, element in self._iter_stream_events(raw_html):
+            tag = element.tag
+
+            if event == 'start':
+                parent = element.getparent()
+                if skip_root is None and parent is not None:
+                    keep_text_before(parent, element.getprevious())
+                if tag in keep_tags:
+                    keep_depth += 1
+                if skip_root is not None:
+                    continue
+                position += 1
+                # The root itself is never removed, as in _remove_boilerplate()
+                if parent is not None and (tag in tag_set or is_boilerplate(
+                        element.get('class', ''), element.get('id', ''))):
+                    skip_root = element
+                    continue
+                if tag == 'article' or tag == 'main':
+                    key = tag
+                elif element.get('role') == 'main':
+                    key = 'role'
+                else:
+                    key = None
+                if key is not None and landmarks[key] is None:
+                    landmarks[key] = [len(strings), None]
+                    open_elements[element] = (position, len(strings), key)
+                elif tag in content_tags:
+                    open_elements[element] = (position, len(strings), None)
+                continue
+
+            # 'end' event: the element and its subtree are complete
+            if skip_root is None:
+                keep_text_before(element, element[-1] if len(element) else None)
+
+            if tag == 'meta':
+                content = element.get('content', '')
+                prop = element.get('property')
+                name = element.get('name')
+                if prop:
+                    by_property.setdefault(prop, content)
+                if name:
+                    by_name.setdefault(name, content)
+
+            elif tag in keep_tags:
+                keep_depth -= 1
+                if tag == 'title' and first_title is None:
+                    first_title = ''.join(element.itertext()).strip()
+                elif tag == 'h1' and first_h1 is None:
+                    first_h1 = ''.join(element.itertext()).strip()
+
+            opened = open_elements.pop(element, None)
+            if opened is not None:
+                pos, start, key = opened
+                end = len(strings)
+                if key is not None:
+                    landmarks[key][1] = end
+                if tag == 'p':
+                    paragraphs.append((pos, start, end))
+                if tag in content_tags and end > start:
+                    text_len = char_totals[end] - char_totals[start] + end - start - 1
+                    # The earliest tag in document order wins ties
+                    if text_len > min_length and (text_len > best_len or (
+                            text_len == best_len and pos < best_pos)):
+                        best_len, best_pos, best_run = text_len, pos, (start, end)
+
+            if element is skip_root:
+                skip_root = None
+
+            # Free what we no longer need, unless an enclosing <title>/<h1>
+            # still has to read this element's text
+            if keep_depth == 0:
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+        # Title: og:title, then <title>, then first <h1>, then URL
+        og_title = by_property.get('og:title')
+        if og_title:
+            title = og_title.strip()
+        elif first_title:
+            title = first_title
+        elif first_h1 is not None:
+            title = first_h1
+        else:
+            title = url.split('/')[-1] or "Untitled"
+
+        metadata = self._build_metadata(url, by_property, by_name)
+
+        # Strategies 1-3: <article>, <main>, role="main"
+        for key in ('article', 'main', 'role'):
+            run = landmarks[key]
+            if run is not None:
+                start, end = run
+                return title, metadata, ' '.join(strings[start:end])
+
+        # Strategy 4: Largest text block
+        if best_run is not None:
+            start, end = best_run
+            return title, metadata, ' '.join(strings[start:end])
+
+        # Strategy 5: All paragraphs, in document order
+        if paragraphs:
+            paragraphs.sort()
+            main_content = ' '.join(
+                ''.join(strings[start:end]) for _, start, end in paragraphs
+            )
+            return title, metadata, main_content
+
+        # Last resort: all text
+        return title, metadata, ' '.join(strings)
+
+    def _iter_stream_events(self, raw_html: str):
+        """
+        Yield lxml ('start'/'end', element) events for raw_html, feeding
+        it to an HTMLPullParser _STREAM_CHUNK_SIZE characters at a time.
+        """
+        from lxml import etree
+
+        parser = etree.HTMLPullParser(events=('start', 'end'))
+        chunk_size = self._STREAM_CHUNK_SIZE
+        try:
+            for offset in range(0, len(raw_html), chunk_size):
+                parser.feed(raw_html[offset:offset + chunk_size])
+                yield from parser.read_events()
+            parser.close()
+        except etree.XMLSyntaxError:
+            return  # Unparseable tail: keep what we have
+        yield from parser.read_events()
+
     def _normalize_text(self, text: str) -> str:
         """
         Normalize and clean extracted text.
 
         DETERMINISTIC TEXT PROCESSING:
-          - Collapse multiple whitespaces
-          - Remove excessive newlines
+          - Normalize unicode characters (NFKC)
+          - Collapse every whitespace run (newlines included) to one space
           - Strip leading/trailing whitespace
-          - Normalize unicode characters
 
         Args:
             text: Raw extracted text
@@ -420,17 +1580,40 @@ class CleanerTool:
         TEACHING NOTE:
         --------------
         Pure string manipulation. No semantic understanding.
-        """
-        # Collapse multiple spaces
-        text = re.sub(r'\s+', ' ', text)
 
-        # Remove excessive newlines (more than 2)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        PERFORMANCE NOTE:
+        -----------------
+        str.split() with no argument splits on the same Unicode whitespace
+        a regex whitespace class matches, and drops leading/trailing runs,
+        so joining the pieces with ' ' equals the old collapse-then-strip
+        regex pair, but in one C loop with no regex engine. (The old
+        second pass, squeezing runs of newlines, was dead code: no newline
+        survived the first.) It is also ~100x faster than a DFA engine such
+        as RE2 doing the same substitution.
+
+        NFKC folds compatibility characters (ligatures, fullwidth forms,
+        no-break spaces) into their plain equivalents. It runs first so
+        folded spaces get collapsed too. is_normalized() is the Unicode
+        Quick Check: a C table lookup per character that answers for most
+        pages, so we only pay for the full normalize() when needed.
+        """
+        if not unicodedata.is_normalized('NFKC', text):
+            text = unicodedata.normalize('NFKC', text)
 
-        # Strip leading/trailing whitespace
-        text = text.strip()
+        return ' '.join(text.split())
 
-        return text
+    def _count_words(self, clean_text: str) -> int:
+        """
+        Count words in text produced by _normalize_text().
+
+        PERFORMANCE NOTE:
+        -----------------
+        Normalized text has exactly one space between words and none at
+        either end, so words = spaces + 1. str.count() scans in C without
+        allocating anything, where len(text.split()) built a list of every
+        word only to take its length.
+        """
+        return clean_text.count(' ') + 1 if clean_text else 0
 
     def extract_structured(self, raw_html: str, url: str = "") -> Dict[str, any]:
         """
@@ -478,29 +1661,62 @@ class CleanerTool:
         if self.debug:
             print(f"\n[CLEANER TOOL] Structured extraction: {url}")
 
-        # Parse HTML
-        soup = BeautifulSoup(raw_html, 'html.parser')
+        cache_key = self._cache_key('structured', raw_html, url)
+        result = self._cache_get(cache_key)
+        if result is not None:
+            if self.debug:
+                print("[CLEANER TOOL] ✓ Cache hit")
+            return result
+
+        if self.use_fast:
+            # Parse HTML
+            root = self._parse_fast(raw_html)
+
+            # Extract basic data (same as clean_html)
+            meta_tags = self._collect_meta_tags_fast(root)
+            title = self._extract_title_fast(root, url, meta_tags)
+            metadata = self._build_metadata(url, *meta_tags)
+
+            # Remove boilerplate
+            self._remove_boilerplate_fast(root)
+
+            # Extract structured data (Phase 3 enhancement)
+            headings = self._extract_headings_fast(root)
+            lists = self._extract_lists_fast(root)
+            tables = self._extract_tables_fast(root)
+            links = self._extract_links_fast(root, url)
+            sections = self._extract_sections_fast(root)
+
+            # Also extract clean text for backward compatibility
+            main_content = self._extract_main_content_fast(root)
+        else:
+            # Parse HTML
+            soup = self._parse(raw_html)
+
+            # Extract basic data (same as clean_html)
+            meta_tags = self._collect_meta_tags(soup)
+            title = self._extract_title(soup, url, meta_tags)
+            metadata = self._extract_metadata(soup, url, meta_tags)
+
+            # Remove boilerplate
+            soup_cleaned = self._remove_boilerplate(soup)
+
+            # Extract structured data (Phase 3 enhancement)
+            # All extractors share one context, so the tree is walked once
+            ctx = _ParseContext(soup_cleaned)
+            headings = self._extract_headings(ctx)
+            lists = self._extract_lists(ctx)
+            tables = self._extract_tables(ctx)
+            links = self._extract_links(ctx, url)
+            sections = self._extract_sections(ctx)
+
+            # Also extract clean text for backward compatibility
+            main_content = self._extract_main_content(soup_cleaned)
 
-        # Extract basic data (same as clean_html)
-        title = self._extract_title(soup, url)
-        metadata = self._extract_metadata(soup, url)
-
-        # Remove boilerplate
-        soup_cleaned = self._remove_boilerplate(soup)
-
-        # Extract structured data (Phase 3 enhancement)
-        headings = self._extract_headings(soup_cleaned)
-        lists = self._extract_lists(soup_cleaned)
-        tables = self._extract_tables(soup_cleaned)
-        links = self._extract_links(soup_cleaned, url)
-        sections = self._extract_sections(soup_cleaned)
-
-        # Also extract clean text for backward compatibility
-        main_content = self._extract_main_content(soup_cleaned)
         clean_text = self._normalize_text(main_content)
 
         # Calculate statistics
-        word_count = len(clean_text.split())
+        word_count = self._count_words(clean_text)
 
         structured_data = {
             'headings': headings,
@@ -538,9 +1754,124 @@ class CleanerTool:
             print(f"  Links: {len(links)}")
             print(f"  Sections: {len(sections)}")
 
+        self._cache_put(cache_key, result)
+        return result
+
+    def _cache_key(self, kind: str, raw_html: str, url: str) -> Optional[Tuple]:
+        """
+        Build the result-cache key for one call, or None if caching is off.
+
+        The HTML is identified by a 16-byte digest from _content_hasher(),
+        so the cache holds small keys rather than whole documents. The URL
+        is part of the key because results embed it (metadata['url'], the
+        title fallback).
+        """
+        if not self.cache_size and self.disk_cache is None:
+            return None
+        digest = _content_hasher()(raw_html.encode('utf-8', 'surrogatepass'))
+        return (kind, url, digest)
+
+    def _cache_get(self, key: Optional[Tuple]) -> Optional[Dict]:
+        """
+        Return a copy of the cached result for key, or None on a miss.
+
+        Results are nested dicts and lists, so callers get a deep copy:
+        mutating a returned result must never change the cached one.
+        """
+        if key is None:
+            return None
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+        # Second level: the on-disk cache. A hit is promoted to memory.
+        result = self._disk_cache_get(key)
+        if result is not None:
+            self._memory_cache_put(key, result)
         return result
 
-    def _extract_headings(self, soup: BeautifulSoup) -> List[Dict]:
+    def _cache_put(self, key: Optional[Tuple], result: Dict):
+        """Store result in the memory cache and, if enabled, on disk."""
+        if key is None:
+            return
+        self._memory_cache_put(key, result)
+        self._disk_cache_put(key, result)
+
+    def _memory_cache_put(self, key: Tuple, result: Dict):
+        """Store a copy of result, evicting the least recently used entry."""
+        if not self.cache_size:
+            return
+        self._result_cache[key] = copy.deepcopy(result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.cache_size:
+            self._result_cache.popitem(last=False)
+
+    # Result kinds the disk cache stores. clean_html() results are plain
+    # JSON data; extract_structured() results hold Heading tuples, which
+    # would come back from JSON as lists.
+    _DISK_CACHE_KINDS = frozenset(['clean'])
+
+    def _disk_cache_conn(self) -> Optional['sqlite3.Connection']:
+        """
+        Open the disk cache on first use, or return None if it's disabled.
+
+        PERFORMANCE NOTE:
+        -----------------
+        Lookups are by primary key in a WITHOUT ROWID table, so a hit is
+        one B-tree search plus a json.loads(), microseconds against the
+        milliseconds a parse costs. WAL mode keeps writes cheap and lets
+        other processes read while one writes.
+        """
+        if self.disk_cache is None:
+            return None
+        if self._disk_conn is None:
+            import sqlite3
+
+            Path(self.disk_cache).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.disk_cache, check_same_thread=False, isolation_level=None
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS html_cache (
+                    kind TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    digest BLOB NOT NULL,
+                    result TEXT NOT NULL,
+                    PRIMARY KEY (kind, url, digest)
+                ) WITHOUT ROWID
+            ''')
+            self._disk_conn = conn
+        return self._disk_conn
+
+    def _disk_cache_get(self, key: Tuple) -> Optional[Dict]:
+        """Return the result stored on disk for key, or None."""
+        if key[0] not in self._DISK_CACHE_KINDS:
+            return None
+        conn = self._disk_cache_conn()
+        if conn is None:
+            return None
+        row = conn.execute(
+            'SELECT result FROM html_cache WHERE kind = ? AND url = ? AND digest = ?',
+            key
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _disk_cache_put(self, key: Tuple, result: Dict):
+        """Persist result under key (first writer wins; results are deterministic)."""
+        if key[0] not in self._DISK_CACHE_KINDS:
+            return
+        conn = self._disk_cache_conn()
+        if conn is None:
+            return
+        conn.execute(
+            'INSERT OR IGNORE INTO html_cache (kind, url, digest, result) VALUES (?, ?, ?, ?)',
+            key + (json.dumps(result),)
+        )
+
+    def _extract_headings(self, ctx: _ParseContext) -> List[Heading]:
         """
         Extract all headings with their hierarchy.
 
@@ -552,27 +1883,33 @@ class CleanerTool:
           - Position in document
 
         Returns:
-            List of dicts: [{'level': 1, 'text': 'Heading', 'position': 0}, ...]
+            List of Heading tuples in document order:
+            [Heading(level=1, text='Heading', position=0), ...]
 
         TEACHING NOTE:
         --------------
         This preserves document structure, helping the Summarizer AGENT
         understand the organization and importance hierarchy of content.
         """
+        return self._build_headings(
+            (tag.name, tag.get_text(strip=True)) for tag in ctx.headings
+        )
+
+    def _build_headings(self, named_texts) -> List[Heading]:
+        """
+        Build Heading tuples from (tag name, text) pairs in document order.
+
+        Shared by _extract_headings() and _extract_headings_fast().
+        """
+        heading_level = self._HEADING_LEVEL
         headings = []
-        for i, tag_name in enumerate(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            level = int(tag_name[1])
-            for tag in soup.find_all(tag_name):
-                text = tag.get_text(strip=True)
-                if text:  # Only include non-empty headings
-                    headings.append({
-                        'level': level,
-                        'text': text,
-                        'position': len(headings)  # Document order
-                    })
+        for name, text in named_texts:
+            if text:  # Only include non-empty headings
+                # position: index in document order
+                headings.append(Heading(heading_level[name], text, len(headings)))
         return headings
 
-    def _extract_lists(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_lists(self, ctx: _ParseContext) -> List[Dict]:
         """
         Extract ordered and unordered lists.
 
@@ -594,7 +1931,7 @@ class CleanerTool:
         lists = []
 
         # Extract unordered lists
-        for ul in soup.find_all('ul'):
+        for ul in ctx.by_name.get('ul', []):
             items = [li.get_text(strip=True) for li in ul.find_all('li', recursive=False)]
             if items:  # Only include non-empty lists
                 lists.append({
@@ -603,7 +1940,7 @@ class CleanerTool:
                 })
 
         # Extract ordered lists
-        for ol in soup.find_all('ol'):
+        for ol in ctx.by_name.get('ol', []):
             items = [li.get_text(strip=True) for li in ol.find_all('li', recursive=False)]
             if items:
                 lists.append({
@@ -613,7 +1950,7 @@ class CleanerTool:
 
         return lists
 
-    def _extract_tables(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_tables(self, ctx: _ParseContext) -> List[Dict]:
         """
         Extract tables as structured data.
 
@@ -634,7 +1971,7 @@ class CleanerTool:
         """
         tables = []
 
-        for table in soup.find_all('table'):
+        for table in ctx.tables:
             # Extract headers
             headers = []
             thead = table.find('thead')
@@ -671,7 +2008,7 @@ class CleanerTool:
 
         return tables
 
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def _extract_links(self, ctx: _ParseContext, base_url: str) -> List[Dict]:
         """
         Extract links with context.
 
@@ -680,7 +2017,7 @@ class CleanerTool:
         Extracts <a> tags with link text and URL.
 
         Args:
-            soup: BeautifulSoup object
+            ctx: Parse context for the cleaned soup
             base_url: Base URL for resolving relative links
 
         Returns:
@@ -694,32 +2031,64 @@ class CleanerTool:
           - Follow related content
           - Understand document connections
         """
-        from urllib.parse import urljoin, urlparse
-
-        links = []
-        base_domain = urlparse(base_url).netloc if base_url else ""
-
-        for a_tag in soup.find_all('a', href=True):
-            text = a_tag.get_text(strip=True)
-            href = a_tag['href']
+        return self._build_links(
+            ((a_tag.get_text(strip=True), a_tag['href']) for a_tag in ctx.anchors),
+            base_url
+        )
 
-            # Resolve relative URLs
-            absolute_url = urljoin(base_url, href) if base_url else href
-
-            # Classify as internal or external
-            link_domain = urlparse(absolute_url).netloc
-            link_type = 'internal' if link_domain == base_domain else 'external'
+    def _build_links(self, text_hrefs, base_url: str) -> List[Dict]:
+        """
+        Build link records from (link text, href) pairs.
+
+        Shared by _extract_links() and _extract_links_fast().
+
+        PERFORMANCE NOTE:
+        -----------------
+        urljoin() and URL parsing are pure Python, so we do as little of
+        both as possible:
+          - Links without text or href are skipped before resolving
+          - Each distinct href is resolved once per page (menus and
+            footers repeat the same hrefs many times)
+          - A relative href (no scheme, not protocol-relative '//') always
+            resolves onto the base URL's host, so it's internal without
+            re-parsing the joined URL
+          - Otherwise urlsplit() gives the netloc; unlike urlparse() it
+            doesn't split out ';params', which we never use
+        """
+        from urllib.parse import urljoin, urlsplit
 
-            if text and href:  # Only include links with text and href
-                links.append({
-                    'text': text,
-                    'url': absolute_url,
-                    'type': link_type
-                })
+        links = []
+        base_domain = urlsplit(base_url).netloc if base_url else ""
+        resolved = {}  # href -> (absolute_url, link_type)
+
+        for text, href in text_hrefs:
+            if not (text and href):  # Only include links with text and href
+                continue
+
+            entry = resolved.get(href)
+            if entry is None:
+                # Resolve relative URLs
+                absolute_url = urljoin(base_url, href) if base_url else href
+
+                # Classify as internal or external
+                if not href.startswith('//') and ':' not in href.partition('/')[0]:
+                    link_type = 'internal'  # Relative: same host as base
+                elif urlsplit(absolute_url).netloc == base_domain:
+                    link_type = 'internal'
+                else:
+                    link_type = 'external'
+
+                entry = resolved[href] = (absolute_url, link_type)
+
+            links.append({
+                'text': text,
+                'url': entry[0],
+                'type': entry[1]
+            })
 
         return links
 
-    def _extract_sections(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_sections(self, ctx: _ParseContext) -> List[Dict]:
         """
         Extract content sections organized by headings.
 
@@ -740,19 +2109,35 @@ class CleanerTool:
           - Generate section-wise summaries
           - Maintain narrative flow
         """
+        # Strings never reach here: the context holds tags only
+        return self._build_sections(
+            ((tag.name, tag) for tag in ctx.all_tags),
+            lambda tag: tag.get_text(strip=True)
+        )
+
+    def _build_sections(self, named_elements, get_text: Callable) -> List[Dict]:
+        """
+        Group body text under headings, from (tag name, element) pairs in
+        document order. get_text(element) is only called for elements
+        whose text is needed.
+
+        Shared by _extract_sections() and _extract_sections_fast().
+        """
         sections = []
         current_section = None
+        heading_level = self._HEADING_LEVEL
+        body_tags = self._SECTION_BODY_TAGS
+
+        for name, element in named_elements:
+            level = heading_level.get(name)
 
-        # Iterate through all elements
-        for element in soup.descendants:
-            if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            if level is not None:
                 # Start new section
                 if current_section:
                     # Finish previous section
                     sections.append(current_section)
 
-                level = int(element.name[1])
-                heading_text = element.get_text(strip=True)
+                heading_text = get_text(element)
 
                 current_section = {
                     'heading': heading_text,
@@ -760,9 +2145,9 @@ class CleanerTool:
                     'content': []
                 }
 
-            elif current_section is not None and element.name in ['p', 'div', 'span']:
+            elif current_section is not None and name in body_tags:
                 # Add content to current section
-                text = element.get_text(strip=True)
+                text = get_text(element)
                 if text and len(text) > 20:  # Only meaningful content
                     current_section['content'].append(text)
 
@@ -777,43 +2162,100 @@ class CleanerTool:
         return sections
 
     def _record_cleaning(self, url: str, result: Dict):
-        """Record cleaning operation in history for debugging."""
-        self._cleaning_history.append({
-            'url': url,
-            'word_count': result['word_count'],
-            'stats': result['extraction_stats'],
-            'timestamp': datetime.now()
-        })
+        """
+        Record cleaning operation in history for debugging.
+
+        The columns grow until they hold history_maxlen rows; after that
+        each record overwrites the oldest row in place (a ring buffer), so
+        nothing is allocated or freed per cleaning.
+        """
+        row = (
+            url,
+            time.time(),
+            result['word_count'],
+            result['extraction_stats']['compression_ratio']
+        )
+        columns = (
+            self._history_urls,
+            self._history_timestamps,
+            self._history_word_counts,
+            self._history_compression_ratios
+        )
+
+        slot = self._history_next
+        if slot == len(self._history_urls):
+            for column, value in zip(columns, row):
+                column.append(value)
+        else:
+            for column, value in zip(columns, row):
+                column[slot] = value
+        self._history_next = (slot + 1) % self.history_maxlen
+        self._total_cleanings += 1
 
     def get_cleaning_stats(self) -> Dict:
         """
         Get statistics about cleaning history.
 
         DEBUGGING HELPER: Analyze cleaner performance and effectiveness.
+        total_cleanings counts every recorded cleaning; the averages and
+        min/max cover the most recent history_maxlen of them.
 
         Returns:
             Dict with avg_word_count, avg_compression_ratio, total_cleanings, etc.
+
+        PERFORMANCE NOTE:
+        -----------------
+        History columns are typed arrays, so NumPy can view their buffers
+        directly (np.frombuffer copies nothing) and compute each aggregate
+        in C, with no per-record Python objects or intermediate lists.
         """
-        if not self._cleaning_history:
+        if not self._history_word_counts:
             return {
                 'total_cleanings': 0,
                 'avg_word_count': 0.0,
                 'avg_compression_ratio': 0.0
             }
 
-        total = len(self._cleaning_history)
-        word_counts = [c['word_count'] for c in self._cleaning_history]
-        compression_ratios = [c['stats']['compression_ratio'] for c in self._cleaning_history]
+        import numpy as np
+
+        word_counts = np.frombuffer(self._history_word_counts, dtype=np.int64)
+        compression_ratios = np.frombuffer(
+            self._history_compression_ratios, dtype=np.float64
+        )
 
         return {
-            'total_cleanings': total,
-            'avg_word_count': sum(word_counts) / total,
-            'min_word_count': min(word_counts),
-            'max_word_count': max(word_counts),
-            'avg_compression_ratio': sum(compression_ratios) / total,
+            'total_cleanings': self._total_cleanings,
+            'avg_word_count': float(word_counts.mean()),
+            'min_word_count': int(word_counts.min()),
+            'max_word_count': int(word_counts.max()),
+            'avg_compression_ratio': float(compression_ratios.mean()),
         }
 
 
+# Shared instance behind the convenience function (created on first use)
+_DEFAULT_CLEANER: Optional[CleanerTool] = None
+
+# Per-process instance used by clean_batch() workers
+_BATCH_CLEANER: Optional[CleanerTool] = None
+
+
+def _init_batch_worker(cleaner_cls: type, use_fast: bool):
+    """Process-pool initializer: build this worker's cleaner once."""
+    global _BATCH_CLEANER
+    _BATCH_CLEANER = cleaner_cls(record_history=False, use_fast=use_fast)
+
+
+def _clean_one(item: Tuple[str, str]) -> Dict[str, any]:
+    """
+    Process-pool worker for CleanerTool.clean_batch().
+
+    Lives at module level so it can be pickled. Each worker process reuses
+    the cleaner built by _init_batch_worker().
+    """
+    raw_html, url = item
+    return _BATCH_CLEANER.clean_html(raw_html, url)
+
+
 # Convenience function for simple one-off cleaning
 def clean_html(raw_html: str, url: str = "") -> Dict[str, any]:
     """
@@ -836,8 +2278,11 @@ def clean_html(raw_html: str, url: str = "") -> Dict[str, any]:
 
     TEACHING NOTE:
     --------------
-    This function creates a new CleanerTool instance for each call.
-    For repeated cleanings, use CleanerTool directly to track history.
+    This function reuses one module-level CleanerTool across calls, so
+    setup is paid once per process. That shared instance does not record
+    history; for repeated cleanings with stats, use CleanerTool directly.
     """
-    cleaner = CleanerTool()
-    return cleaner.clean_html(raw_html, url)
+    global _DEFAULT_CLEANER
+    if _DEFAULT_CLEANER is None:
+        _DEFAULT_CLEANER = CleanerTool(record_history=False)
+    return _DEFAULT_CLEANER.clean_html(raw_html, url)
@@ -44,9 +44,13 @@ DEBUGGING TIPS:
   • Test query performance with large datasets
 """
 
+import atexit
 import sqlite3
 import json
-from typing import Dict, List, Optional
+import threading
+import weakref
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -54,6 +58,143 @@ from pathlib import Path
 # Database path
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "missions.sqlite"
 
+# Loggers that may still hold buffered fetch rows; flushed at exit
+_OPEN_LOGGERS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_loggers():
+    for logger in list(_OPEN_LOGGERS):
+        logger.close()
+
+
+# Database files whose tables and indexes this process has already
+# created. Each CREATE ... IF NOT EXISTS still has to read the schema to
+# find out it has nothing to do, so later LoggerTools on the same file
+# (and repeated init_database() calls) run one _SQL_SCHEMA_PRESENT
+# lookup instead of the whole DDL script. The lookup is still needed:
+# the file may have been deleted and recreated empty since.
+_SCHEMA_READY_PATHS = set()
+
+# Column order of the SELECTs below. Rows come back as plain tuples and
+# are zipped with these names: cheaper than sqlite3.Row plus dict(row),
+# which builds a Row object and then a dict for every result row.
+_MISSION_COLUMNS = (
+    'mission_id', 'topic', 'status', 'created_at', 'completed_at',
+    'source_count', 'summary_count', 'metadata'
+)
+_SUMMARY_COLUMNS = (
+    'id', 'mission_id', 'summary_text', 'style', 'word_count',
+    'quality_score', 'timestamp'
+)
+_MISSION_SELECT = 'SELECT ' + ', '.join(_MISSION_COLUMNS) + ' FROM missions'
+
+# Hot-path SQL, defined once. sqlite3 keeps compiled statements in a
+# per-connection cache keyed by SQL text, so passing the same string on
+# every call skips SQLite's parse and plan step.
+# Re-logging a mission updates its row in place. INSERT OR REPLACE would
+# delete the old row and insert a new one, rewriting every index entry.
+# UPSERT (ON CONFLICT ... DO UPDATE) needs SQLite 3.24+; older libraries
+# keep the REPLACE form. Every column is updated, as REPLACE did.
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    _SQL_INSERT_MISSION = '''
+        INSERT INTO missions
+        (mission_id, topic, status, created_at, completed_at, source_count, summary_count, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(mission_id) DO UPDATE SET
+            topic = excluded.topic,
+            status = excluded.status,
+            created_at = excluded.created_at,
+            completed_at = excluded.completed_at,
+            source_count = excluded.source_count,
+            summary_count = excluded.summary_count,
+            metadata = excluded.metadata
+    '''
+else:
+    _SQL_INSERT_MISSION = '''
+        INSERT OR REPLACE INTO missions
+        (mission_id, topic, status, created_at, completed_at, source_count, summary_count, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+_SQL_INSERT_FETCH = '''
+    INSERT INTO fetches (mission_id, url, status_code, fetch_time, timestamp)
+    VALUES (?, ?, ?, ?, ?)
+'''
+_SQL_INSERT_SUMMARY = '''
+    INSERT INTO summaries (mission_id, summary_text, style, word_count, quality_score, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+_SQL_RECENT_MISSIONS = _MISSION_SELECT + ' ORDER BY created_at DESC LIMIT ?'
+_SQL_MISSION_BY_ID = _MISSION_SELECT + ' WHERE mission_id = ?'
+_SQL_ALL_MISSIONS = _MISSION_SELECT + ' ORDER BY created_at DESC'
+_SQL_MISSION_SUMMARIES = (
+    'SELECT ' + ', '.join(_SUMMARY_COLUMNS) + ' FROM summaries'
+    ' WHERE mission_id = ? ORDER BY timestamp'
+)
+# All of get_mission_stats() in one statement: one scan of missions with
+# conditional aggregation (status = 'completed' is 1 or 0), plus the two
+# table counts as scalar subqueries. SUM() over no rows is NULL, hence
+# the COALESCE.
+_SQL_MISSION_STATS = '''
+    SELECT COUNT(*),
+           COALESCE(SUM(status = 'completed'), 0),
+           (SELECT COUNT(*) FROM fetches),
+           (SELECT COUNT(*) FROM summaries)
+    FROM missions
+'''
+
+# Cheap check that a cached path still has its schema (see
+# _SCHEMA_READY_PATHS): one indexed read of the schema table
+_SQL_SCHEMA_PRESENT = (
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'missions'"
+)
+
+# Statement cache size per connection (sqlite3's default is 128)
+_CACHED_STATEMENTS = 256
+
+
+class _ReadOnlyDict(dict):
+    """
+    A dict that refuses in-place changes.
+
+    Parsed metadata is cached and shared between callers, so one caller
+    must not be able to edit another's copy. It is still a real dict:
+    isinstance() checks, json.dumps() and st.json() all keep working.
+    copy.deepcopy() and pickle produce another _ReadOnlyDict.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("mission metadata is read-only; copy it with dict() first")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (_ReadOnlyDict, (dict(self),))
+
+
+@lru_cache(maxsize=4096)
+def _parse_metadata(raw: Optional[str]) -> Dict:
+    """
+    Parse a mission's stored metadata JSON, memoized by the raw string.
+
+    NULL (empty metadata is stored that way) and '' give an empty dict.
+
+    PERFORMANCE NOTE:
+    -----------------
+    Metadata never changes once written, and trend analysis re-reads every
+    mission on each pass. Caching by the JSON text turns repeat scans into
+    dict lookups instead of JSON parses. object_hook makes every nested
+    object read-only too, so the shared result can't be altered.
+    (Lists inside metadata are still shared mutable lists.)
+    """
+    if not raw:
+        return _ReadOnlyDict()
+    try:
+        return json.loads(raw, object_hook=_ReadOnlyDict)
+    except (ValueError, TypeError):
+        return _ReadOnlyDict()
+
 
 class LoggerTool:
     """
@@ -84,8 +225,26 @@ class LoggerTool:
     --------------
     This is a fully functional SQLite logger demonstrating
     persistent state management and structured data storage.
+
+    PERFORMANCE NOTE:
+    -----------------
+    One connection is opened in __init__ and reused by every method.
+    Opening a connection means opening the file, reading its header and
+    parsing the schema, which costs far more than the INSERT itself.
+    The connection runs in autocommit mode (isolation_level=None), so
+    each statement is committed as it executes, just as the old
+    connect/commit/close blocks did. A lock serializes access so one
+    logger can be shared across threads. Call close() when done, or
+    let garbage collection do it.
+
+    Fetch rows are buffered and written FETCH_BUFFER_SIZE at a time in
+    one transaction (see flush_fetches()), so a 50-source mission costs
+    one commit, not 50.
     """
 
+    # Buffered fetch rows are flushed once this many accumulate
+    FETCH_BUFFER_SIZE = 100
+
     def __init__(self, db_path: Optional[Path] = None, debug: bool = False):
         """
         Initialize the Logger Tool.
@@ -96,14 +255,42 @@ class LoggerTool:
         """
         self.db_path = db_path or DB_PATH
         self.debug = debug
+        self._lock = threading.Lock()
+        self._conn = None
+        self._fetch_buffer: List[Tuple] = []
         self._ensure_database()
+        _OPEN_LOGGERS.add(self)
 
     def _ensure_database(self):
-        """Ensure database and tables exist."""
+        """Open the shared connection and ensure the tables exist."""
+        # Not cached per process: the directory may be removed between
+        # LoggerTools, and with exist_ok this is a single syscall anyway
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # check_same_thread=False: the connection may be used from any
+        # thread, because every use happens under self._lock
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS
+        )
+        cursor = self._conn.cursor()
+
+        # PERFORMANCE NOTE: the default rollback journal with
+        # synchronous=FULL fsyncs on every commit, and in autocommit mode
+        # that is every INSERT. In WAL mode commits append to a log, and
+        # synchronous=NORMAL only fsyncs it at checkpoints (still safe
+        # against application crashes; a power cut can lose the last few
+        # commits). Readers no longer block the writer, either.
+        # journal_mode is stored in the file; the rest are per connection.
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=268435456')  # 256 MB
+        cursor.execute('PRAGMA cache_size=-65536')  # 64 MB (negative = KiB)
+
+        if (self.db_path in _SCHEMA_READY_PATHS
+                and cursor.execute(_SQL_SCHEMA_PRESENT).fetchone()):
+            return
 
         # Create missions table
         cursor.execute('''
@@ -148,11 +335,32 @@ class LoggerTool:
 
         # Create indexes for performance
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_missions_timestamp ON missions(created_at)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_fetches_mission ON fetches(mission_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_summaries_mission ON summaries(mission_id)')
 
-        conn.commit()
-        conn.close()
+        # (mission_id, timestamp) composites: "WHERE mission_id = ? ORDER BY
+        # timestamp" becomes one index range scan already in order, with
+        # no separate sort. They also serve plain mission_id lookups, so
+        # the old single-column indexes are dropped (fewer index writes).
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_fetches_mission_ts ON fetches(mission_id, timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_summaries_mission_ts ON summaries(mission_id, timestamp)')
+        cursor.execute('DROP INDEX IF EXISTS idx_fetches_mission')
+        cursor.execute('DROP INDEX IF EXISTS idx_summaries_mission')
+
+        # Every connection to ':memory:' is a fresh, empty database
+        if str(self.db_path) != ':memory:':
+            _SCHEMA_READY_PATHS.add(self.db_path)
+
+    def close(self):
+        """Flush buffered fetches and close the connection. Safe to call twice."""
+        with self._lock:
+            if self._conn is not None:
+                self._flush_fetches_locked()
+                self._conn.close()
+                self._conn = None
+
+    def __del__(self):
+        # __init__ may have failed before the lock or connection existed
+        if getattr(self, '_conn', None) is not None:
+            self.close()
 
     def log_mission(self, mission_data: Dict) -> str:
         """
@@ -184,7 +392,10 @@ class LoggerTool:
         status = mission_data.get('status', 'pending')
         source_count = mission_data.get('source_count', 0)
         summary_count = mission_data.get('summary_count', 0)
-        metadata = json.dumps(mission_data.get('metadata', {}))
+        # Empty metadata is stored as NULL, skipping a json.dumps() that
+        # would only produce '{}'; reads turn NULL back into {}
+        metadata = mission_data.get('metadata')
+        metadata = json.dumps(metadata) if metadata else None
         created_at = mission_data.get('created_at', datetime.now())
         completed_at = mission_data.get('completed_at')
 
@@ -193,101 +404,142 @@ class LoggerTool:
             print(f"[LOGGER TOOL] Topic: {topic}")
             print(f"[LOGGER TOOL] Status: {status}")
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT OR REPLACE INTO missions
-            (mission_id, topic, status, created_at, completed_at, source_count, summary_count, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (mission_id, topic, status, created_at, completed_at, source_count, summary_count, metadata))
-
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(
+                _SQL_INSERT_MISSION,
+                (mission_id, topic, status, created_at, completed_at, source_count, summary_count, metadata)
+            )
 
         if self.debug:
             print(f"[LOGGER TOOL] ✓ Mission logged successfully")
 
         return mission_id
 
-    def log_fetch(self, mission_id: str, url: str, status_code: int, fetch_time: float):
-        """Log a URL fetch operation."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def log_fetch(
+        self,
+        mission_id: str,
+        url: str,
+        status_code: int,
+        fetch_time: float,
+        timestamp: Optional[datetime] = None
+    ):
+        """
+        Log a URL fetch operation.
 
-        cursor.execute('''
-            INSERT INTO fetches (mission_id, url, status_code, fetch_time, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (mission_id, url, status_code, fetch_time, datetime.now()))
+        The row is buffered, not written: it reaches the database on the
+        next flush_fetches(), once FETCH_BUFFER_SIZE rows are pending, when
+        stats are read, or on close() (which also runs at interpreter
+        exit). Call flush_fetches() at mission end so other connections
+        see the rows sooner.
+
+        Args:
+            timestamp: When the fetch happened (default: now). Loops
+                logging many rows can pass one shared value.
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        with self._lock:
+            self._fetch_buffer.append(
+                (mission_id, url, status_code, fetch_time, timestamp)
+            )
+            if len(self._fetch_buffer) >= self.FETCH_BUFFER_SIZE:
+                self._flush_fetches_locked()
 
-        conn.commit()
-        conn.close()
+    def log_fetches_batch(self, rows: List[Tuple], timestamp: Optional[datetime] = None):
+        """
+        Log many URL fetches in one transaction.
+
+        Every row gets the same timestamp (default: now, read once for the
+        batch rather than once per row).
+
+        Args:
+            rows: (mission_id, url, status_code, fetch_time) tuples
+            timestamp: Timestamp recorded for the whole batch
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        with self._lock:
+            self._fetch_buffer.extend(
+                (mission_id, url, status_code, fetch_time, timestamp)
+                for mission_id, url, status_code, fetch_time in rows
+            )
+            self._flush_fetches_locked()
+
+    def flush_fetches(self):
+        """Write all buffered fetch rows to the database in one transaction."""
+        with self._lock:
+            self._flush_fetches_locked()
+
+    def _flush_fetches_locked(self):
+        """
+        Write the fetch buffer with one executemany(). Caller holds the lock.
 
-    def log_summary(self, mission_id: str, summary_data: Dict):
-        """Log a generated summary."""
+        PERFORMANCE NOTE:
+        -----------------
+        The connection is in autocommit mode, where executemany() would
+        still commit row by row. The explicit BEGIN/COMMIT makes the whole
+        batch a single transaction: one journal write instead of one per row.
+        """
+        if not self._fetch_buffer:
+            return
+
+        self._conn.execute('BEGIN')
+        try:
+            self._conn.executemany(_SQL_INSERT_FETCH, self._fetch_buffer)
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
+        self._fetch_buffer.clear()
+
+    def log_summary(
+        self,
+        mission_id: str,
+        summary_data: Dict,
+        timestamp: Optional[datetime] = None
+    ):
+        """
+        Log a generated summary.
+
+        Args:
+            timestamp: When the summary was made (default: now). Loops
+                logging many summaries can pass one shared value.
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
         summary_text = summary_data.get('summary', '')
         style = summary_data.get('style', 'unknown')
         word_count = summary_data.get('word_count', 0)
         quality_score = summary_data.get('score', 0.0)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO summaries (mission_id, summary_text, style, word_count, quality_score, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (mission_id, summary_text, style, word_count, quality_score, datetime.now()))
-
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(
+                _SQL_INSERT_SUMMARY,
+                (mission_id, summary_text, style, word_count, quality_score, timestamp)
+            )
 
     def get_mission_history(self, limit: int = 10) -> List[Dict]:
         """Retrieve recent mission history."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._lock:
+            rows = self._conn.execute(_SQL_RECENT_MISSIONS, (limit,)).fetchall()
 
-        cursor.execute('''
-            SELECT * FROM missions
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', (limit,))
-
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [dict(row) for row in rows]
+        return [dict(zip(_MISSION_COLUMNS, row)) for row in rows]
 
     def get_mission_by_id(self, mission_id: str) -> Optional[Dict]:
         """Retrieve a specific mission by ID."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._lock:
+            row = self._conn.execute(_SQL_MISSION_BY_ID, (mission_id,)).fetchone()
 
-        cursor.execute('SELECT * FROM missions WHERE mission_id = ?', (mission_id,))
-        row = cursor.fetchone()
-        conn.close()
-
-        return dict(row) if row else None
+        return dict(zip(_MISSION_COLUMNS, row)) if row else None
 
     def get_mission_stats(self) -> Dict:
         """Get overall statistics about all missions."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT COUNT(*) FROM missions')
-        total_missions = cursor.fetchone()[0]
-
-        cursor.execute('SELECT COUNT(*) FROM missions WHERE status = "completed"')
-        completed_missions = cursor.fetchone()[0]
-
-        cursor.execute('SELECT COUNT(*) FROM fetches')
-        total_fetches = cursor.fetchone()[0]
-
-        cursor.execute('SELECT COUNT(*) FROM summaries')
-        total_summaries = cursor.fetchone()[0]
-
-        conn.close()
+        with self._lock:
+            # Count buffered fetches too
+            self._flush_fetches_locked()
+            total_missions, completed_missions, total_fetches, total_summaries = (
+                self._conn.execute(_SQL_MISSION_STATS).fetchone()
+            )
 
         return {
             'total_missions': total_missions,
@@ -308,28 +560,40 @@ class LoggerTool:
 
         Returns:
             List of all missions with parsed metadata
+
+        TrendAnalyzer makes several passes and takes len(), so it needs
+        this list. Single-pass consumers can use iter_missions() instead.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        return list(self.iter_missions())
 
-        cursor.execute('SELECT * FROM missions ORDER BY created_at DESC')
-        rows = cursor.fetchall()
+    def iter_missions(self, batch_size: int = 256) -> Iterator[Dict]:
+        """
+        Yield all missions, newest first, with parsed metadata.
 
-        missions = []
-        for row in rows:
-            mission = dict(row)
-            # Parse JSON metadata
-            if mission['metadata']:
-                try:
-                    mission['metadata'] = json.loads(mission['metadata'])
-                except:
-                    mission['metadata'] = {}
+        PERFORMANCE NOTE:
+        -----------------
+        Rows are fetched batch_size at a time, so a scan over N missions
+        holds one batch in memory instead of every row and every dict at
+        once, and the first mission arrives without reading the rest.
+        The lock is held only while fetching a batch, never across a
+        yield, so the loop body may call other logger methods.
 
-            missions.append(mission)
+        Args:
+            batch_size: Rows fetched from SQLite per round trip
+        """
+        with self._lock:
+            cursor = self._conn.execute(_SQL_ALL_MISSIONS)
+            rows = cursor.fetchmany(batch_size)
 
-        conn.close()
-        return missions
+        while rows:
+            for row in rows:
+                mission = dict(zip(_MISSION_COLUMNS, row))
+                # Parse JSON metadata
+                mission['metadata'] = _parse_metadata(mission['metadata'])
+                yield mission
+
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
 
     def get_mission_with_summaries(self, mission_id: str) -> Optional[Dict]:
         """
@@ -350,45 +614,51 @@ class LoggerTool:
             return None
 
         # Get summaries
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT * FROM summaries
-            WHERE mission_id = ?
-            ORDER BY timestamp
-        ''', (mission_id,))
-
-        summary_rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            summary_rows = self._conn.execute(
+                _SQL_MISSION_SUMMARIES, (mission_id,)
+            ).fetchall()
 
-        mission['summaries'] = [dict(row) for row in summary_rows]
+        mission['summaries'] = [dict(zip(_SUMMARY_COLUMNS, row)) for row in summary_rows]
 
         # Parse metadata
-        if mission['metadata']:
-            try:
-                mission['metadata'] = json.loads(mission['metadata'])
-            except:
-                mission['metadata'] = {}
+        mission['metadata'] = _parse_metadata(mission['metadata'])
 
         return mission
 
 
+# Shared instance behind the convenience functions (created on first use)
+_DEFAULT_LOGGER: Optional[LoggerTool] = None
+
+
+def _get_default_logger() -> LoggerTool:
+    """
+    Return the shared LoggerTool, creating it on the first call.
+
+    PERFORMANCE NOTE:
+    -----------------
+    Building a LoggerTool opens a connection and runs the schema checks in
+    _ensure_database(). The convenience functions used to pay that on
+    every call; now it's once per process, on the default DB_PATH.
+    """
+    global _DEFAULT_LOGGER
+    if _DEFAULT_LOGGER is None:
+        _DEFAULT_LOGGER = LoggerTool()
+    return _DEFAULT_LOGGER
+
+
 # Convenience functions for simple one-off logging
 def init_database() -> bool:
     """Initialize the database (creates tables if needed)."""
-    logger = LoggerTool()
+    _get_default_logger()
     return True
 
 
 def log_mission(mission_data: Dict) -> str:
     """Simple convenience function for logging a mission."""
-    logger = LoggerTool()
-    return logger.log_mission(mission_data)
+    return _get_default_logger().log_mission(mission_data)
 
 
 def get_mission_history(limit: int = 10) -> List[Dict]:
     """Simple convenience function for retrieving mission history."""
-    logger = LoggerTool()
-    return logger.get_mission_history(limit)
+    return _get_default_logger().get_mission_history(limit)
@@ -61,8 +61,6 @@ demonstrates the transition from TOOL → AGENT.
 FUTURE EXTENSIONS:
 ------------------
   • Async fetching for concurrent requests
-  • Retry logic with exponential backoff
-  • Caching to avoid redundant fetches
   • robots.txt compliance checking
 
 DEBUGGING TIPS:
@@ -72,10 +70,23 @@ DEBUGGING TIPS:
   • Track success/failure rates by domain
 """
 
+import math
 import requests
 import time
-from typing import Tuple, Optional, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests.compat import chardet
+from collections import OrderedDict, deque, namedtuple
+from typing import Tuple, Optional, Dict, Union
 from datetime import datetime
+from pathlib import Path
+
+from ..utils.json_lines import write_json_lines
+
+
+# A page kept for conditional re-fetching: the validators the server sent
+# with it, and the raw body (plus its charset) to hand back on a 304
+CachedPage = namedtuple('CachedPage', 'etag last_modified body encoding')
 
 
 class ScraperTool:
@@ -113,24 +124,128 @@ class ScraperTool:
         "Educational research crawler"
     )
 
-    def __init__(self, user_agent: Optional[str] = None, debug: bool = False):
+    # Connection pool sizing for the shared session: how many hosts keep a
+    # pool, and how many keep-alive connections each pool holds
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+
+    # Largest response body we'll download, and the read size used to
+    # stream it in
+    DEFAULT_MAX_BYTES = 5 * 1024 * 1024  # 5 MB
+    READ_CHUNK_SIZE = 64 * 1024
+
+    # Status reported when the body is over max_bytes (HTTP's "Content
+    # Too Large"). Unlike 0 (network error) it is not worth retrying: the
+    # page will be just as large next time.
+    STATUS_TOO_LARGE = 413
+
+    def __init__(
+        self,
+        user_agent: Optional[str] = None,
+        debug: bool = False,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cache_size: int = 512,
+        history_size: int = 1024,
+        retries: int = 0
+    ):
         """
         Initialize the Scraper Tool.
 
         Args:
             user_agent: Custom user-agent string (uses default if None)
             debug: Enable detailed logging of fetch operations
+            max_bytes: Fail fetches whose body is larger than this
+            cache_size: Most pages kept for conditional re-fetching
+                (0 disables the cache)
+            history_size: Most recent fetches kept in the fetch history
+            retries: Transport-level retries for connection failures and
+                429/5xx responses (0 = none, the default)
+
+        PERFORMANCE NOTE:
+        -----------------
+        requests.get() builds a throwaway Session per call, so every fetch
+        paid a fresh TCP (and TLS) handshake even when the previous fetch
+        hit the same host. One Session per tool keeps those connections
+        alive in a urllib3 pool and reuses them. Call close() (or use the
+        tool as a context manager) to release the sockets early.
+
+        Responses are requested compressed. urllib3 advertises gzip and
+        deflate, and adds br when the optional brotli package is installed
+        (HTML usually shrinks further with br than with gzip). We don't
+        set Accept-Encoding ourselves: asking for br without brotli would
+        return bodies urllib3 can't decode.
+
+        The fetch history keeps only the last history_size records, so a
+        long-lived scraper doesn't grow without bound. get_fetch_stats()
+        still covers every fetch: it reads running totals kept by
+        _record_fetch() rather than rescanning the history.
+
+        retries > 0 hands retrying to urllib3's Retry, inside the adapter:
+        exponential backoff, Retry-After honoured on 429/503, and only
+        the final attempt comes back to fetch_url(). It's off by default
+        because the FlowController and ScraperAgent already retry (and
+        decide when to give up) at their level; stacking both would
+        multiply the attempts.
         """
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
         self.debug = debug
-        self._fetch_history = []  # Track all fetches for debugging
+        self.max_bytes = max_bytes
+        self.cache_size = cache_size
+        self._fetch_history = deque(maxlen=history_size)  # Recent fetches, for debugging
+        self._reset_stats()
+        self._page_cache: 'OrderedDict[Tuple, CachedPage]' = OrderedDict()
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=self._retry_policy(retries)
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers['User-Agent'] = self.user_agent
+
+    # Error message for each kind of requests failure, checked in order;
+    # anything else is reported as "Request error: ..."
+    _REQUEST_ERRORS = (
+        (requests.exceptions.Timeout, "Request timeout after {timeout}s"),
+        (requests.exceptions.ConnectionError, "Connection error: {error}"),
+        (requests.exceptions.TooManyRedirects, "Too many redirects"),
+    )
+
+    # Responses worth retrying: rate limited, or a transient server error
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def _retry_policy(self, retries: int) -> Union[int, Retry]:
+        """Build the urllib3 Retry used by the session's adapter."""
+        if not retries:
+            return 0  # requests' own default: no retries
+        return Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False  # hand back the last response, not an error
+        )
+
+    def close(self):
+        """Close the pooled connections. The tool reconnects if used again."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def fetch_url(
         self,
         url: str,
         timeout: int = 30,
-        headers: Optional[Dict[str, str]] = None
-    ) -> Tuple[Optional[str], int, str, Dict]:
+        headers: Optional[Dict[str, str]] = None,
+        return_bytes: bool = False
+    ) -> Tuple[Optional[Union[str, bytes]], int, str, Dict]:
         """
         Fetch raw HTML content from a URL.
 
@@ -141,13 +256,19 @@ class ScraperTool:
             url: The URL to fetch
             timeout: Request timeout in seconds
             headers: Optional custom headers (merged with defaults)
+            return_bytes: Return the undecoded body as bytes, with its
+                charset (None if the server sent none) in
+                metadata['encoding']
 
         Returns:
             Tuple of (html_content, status_code, error_message, metadata)
-            - html_content: Raw HTML string, or None if fetch failed
-            - status_code: HTTP status code (200, 404, 500, etc.), 0 if network error
+            - html_content: Raw HTML string (bytes if return_bytes), or
+              None if fetch failed
+            - status_code: HTTP status code (200, 404, 500, etc.), 0 if network
+              error, STATUS_TOO_LARGE (413) if the body is over max_bytes
             - error_message: Empty string on success, error details on failure
-            - metadata: Dict with response_time, content_length, final_url, etc.
+            - metadata: Dict with response_time, content_length (bytes of
+              the returned page, cached or not), final_url, etc.
 
         Example:
             >>> scraper = ScraperTool()
@@ -163,21 +284,49 @@ class ScraperTool:
           - PlannerAgent makes decisions about WHAT to fetch
           - ScraperTool just executes the fetch mechanically
         This is the key difference between AGENT and TOOL.
+
+        PERFORMANCE NOTE:
+        -----------------
+        The body is streamed in READ_CHUNK_SIZE pieces and decoded once at
+        the end, rather than through response.content and response.text.
+        A page over max_bytes is abandoned as soon as its Content-Length
+        header (or the running byte count) gives it away, before the rest
+        of it is downloaded or decoded.
+
+        Pages served with an ETag or Last-Modified header are cached, and
+        fetching them again sends If-None-Match / If-Modified-Since. When
+        the server answers 304 Not Modified, no body is transferred and
+        the cached HTML is returned with status 200 (metadata['cached'] is
+        True). The cache is keyed by URL plus custom headers.
+
+        Pass return_bytes=True when the body goes straight to a parser
+        that accepts bytes (lxml does, and decodes in C): it skips the
+        decode pass and the str copy of the whole page.
         """
-        start_time = time.time()
+        # monotonic(): intervals can't be skewed by wall-clock adjustments
+        start_time = time.monotonic()
         metadata = {
             'url': url,
             'timestamp': datetime.now(),
             'response_time': 0.0,
             'content_length': 0,
             'final_url': url,  # May differ if redirected
-            'headers': {}
+            'headers': {},
+            'cached': False
         }
 
-        # Prepare headers with user-agent
-        request_headers = {'User-Agent': self.user_agent}
-        if headers:
-            request_headers.update(headers)
+        cache_key = None
+        cached = None
+        if self.cache_size:
+            cache_key = (url, tuple(sorted(headers.items())) if headers else ())
+            cached = self._page_cache.get(cache_key)
+            if cached is not None:
+                # Ask the server to skip the body if our copy is current
+                headers = dict(headers) if headers else {}
+                if cached.etag:
+                    headers['If-None-Match'] = cached.etag
+                if cached.last_modified:
+                    headers['If-Modified-Since'] = cached.last_modified
 
         if self.debug:
             print(f"\n[SCRAPER TOOL] Fetching: {url}")
@@ -187,83 +336,132 @@ class ScraperTool:
         try:
             # Execute the HTTP GET request
             # TEACHING NOTE: This is the actual "limb reaching out" to the web
-            response = requests.get(
+            # The session already sends our User-Agent; custom headers are
+            # merged over the session's for this request only
+            response = self._session.get(
                 url,
-                headers=request_headers,
+                headers=headers or None,
                 timeout=timeout,
-                allow_redirects=True
+                allow_redirects=True,
+                stream=True
             )
+            metadata['final_url'] = response.url
+            metadata['headers'] = dict(response.headers)
+
+            # Read the body, giving up once it passes max_bytes
+            body = self._read_body(response)
 
             # Calculate response time
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             metadata['response_time'] = response_time
-            metadata['final_url'] = response.url
-            metadata['headers'] = dict(response.headers)
-            metadata['content_length'] = len(response.content)
 
-            # Check for HTTP errors (4xx, 5xx)
-            if response.status_code >= 400:
-                error_msg = f"HTTP {response.status_code}: {response.reason}"
+            if body is None:
+                error_msg = f"Content too large (over {self.max_bytes} bytes)"
                 if self.debug:
-                    print(f"[SCRAPER TOOL] ❌ Failed: {error_msg}")
-
-                self._record_fetch(url, response.status_code, error_msg, metadata)
-                return (None, response.status_code, error_msg, metadata)
+                    print(f"[SCRAPER TOOL] ❌ {error_msg}: {url}")
+
+                status_code = self.STATUS_TOO_LARGE
+                self._record_fetch(url, status_code, error_msg, metadata)
+                return (None, status_code, error_msg, metadata)
+
+            metadata['content_length'] = len(body)
+
+            # Not modified: our cached copy is still current
+            if response.status_code == 304 and cached is not None:
+                self._page_cache.move_to_end(cache_key)
+                metadata['cached'] = True
+                status_code = 200
+                body, encoding = cached.body, cached.encoding
+                # Describe the page returned, not the empty 304 body
+                metadata['content_length'] = len(body)
+                if self.debug:
+                    print(f"[SCRAPER TOOL] ✓ Not modified, using cached copy: {url}")
+            else:
+                # Check for HTTP errors (4xx, 5xx)
+                if response.status_code >= 400:
+                    error_msg = f"HTTP {response.status_code}: {response.reason}"
+                    if self.debug:
+                        print(f"[SCRAPER TOOL] ❌ Failed: {error_msg}")
+
+                    self._record_fetch(url, response.status_code, error_msg, metadata)
+                    return (None, response.status_code, error_msg, metadata)
+
+                status_code = response.status_code
+                encoding = response.encoding
+                # Only a 2xx carries the page. A 304 reaches here when the
+                # caller sent their own If-None-Match/If-Modified-Since, and
+                # its empty body must not be cached as the page.
+                if cache_key is not None and 200 <= status_code < 300:
+                    self._cache_page(cache_key, response, body)
 
             # Success!
-            html_content = response.text
+            if return_bytes:
+                html_content = body
+                metadata['encoding'] = encoding
+            else:
+                html_content = _decode_body(body, encoding)
             if self.debug:
                 print(f"[SCRAPER TOOL] ✓ Success: {len(html_content)} chars in {response_time:.2f}s")
 
-            self._record_fetch(url, response.status_code, "", metadata)
-            return (html_content, response.status_code, "", metadata)
-
-        except requests.exceptions.Timeout:
-            error_msg = f"Request timeout after {timeout}s"
-            if self.debug:
-                print(f"[SCRAPER TOOL] ❌ Timeout: {url}")
-
-            metadata['response_time'] = time.time() - start_time
-            self._record_fetch(url, 0, error_msg, metadata)
-            return (None, 0, error_msg, metadata)
-
-        except requests.exceptions.ConnectionError as e:
-            error_msg = f"Connection error: {str(e)[:100]}"
-            if self.debug:
-                print(f"[SCRAPER TOOL] ❌ Connection error: {url}")
-
-            metadata['response_time'] = time.time() - start_time
-            self._record_fetch(url, 0, error_msg, metadata)
-            return (None, 0, error_msg, metadata)
-
-        except requests.exceptions.TooManyRedirects:
-            error_msg = "Too many redirects"
-            if self.debug:
-                print(f"[SCRAPER TOOL] ❌ Too many redirects: {url}")
-
-            metadata['response_time'] = time.time() - start_time
-            self._record_fetch(url, 0, error_msg, metadata)
-            return (None, 0, error_msg, metadata)
+            self._record_fetch(url, status_code, "", metadata)
+            return (html_content, status_code, "", metadata)
 
         except requests.exceptions.RequestException as e:
-            error_msg = f"Request error: {str(e)[:100]}"
-            if self.debug:
-                print(f"[SCRAPER TOOL] ❌ Request error: {url}")
-                print(f"[SCRAPER TOOL]    {error_msg}")
-
-            metadata['response_time'] = time.time() - start_time
-            self._record_fetch(url, 0, error_msg, metadata)
-            return (None, 0, error_msg, metadata)
+            # First matching entry wins (ConnectTimeout is both a Timeout
+            # and a ConnectionError, and reads as a timeout)
+            for error_type, template in self._REQUEST_ERRORS:
+                if isinstance(e, error_type):
+                    break
+            else:
+                template = "Request error: {error}"
+            error_msg = template.format(timeout=timeout, error=str(e)[:100])
 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)[:100]}"
-            if self.debug:
-                print(f"[SCRAPER TOOL] ❌ Unexpected error: {url}")
-                print(f"[SCRAPER TOOL]    {error_msg}")
 
-            metadata['response_time'] = time.time() - start_time
-            self._record_fetch(url, 0, error_msg, metadata)
-            return (None, 0, error_msg, metadata)
+        # Only failures reach this point; every success path returns above
+        if self.debug:
+            print(f"[SCRAPER TOOL] ❌ Failed: {url}")
+            print(f"[SCRAPER TOOL]    {error_msg}")
+
+        metadata['response_time'] = time.monotonic() - start_time
+        self._record_fetch(url, 0, error_msg, metadata)
+        return (None, 0, error_msg, metadata)
+
+    def _read_body(self, response: requests.Response) -> Optional[bytes]:
+        """
+        Read a streamed response body, or return None if it's over max_bytes.
+
+        Reading the body to the end hands the connection back to the pool;
+        an oversized response is closed instead.
+        """
+        declared = response.headers.get('Content-Length')
+        if declared and declared.isdigit() and int(declared) > self.max_bytes:
+            response.close()
+            return None
+
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(self.READ_CHUNK_SIZE):
+            total += len(chunk)
+            if total > self.max_bytes:
+                response.close()
+                return None
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def _cache_page(self, key: Tuple, response: requests.Response, body: bytes):
+        """Cache body if the response has validators, evicting the LRU page."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            # Nothing to revalidate with; drop any stale copy
+            self._page_cache.pop(key, None)
+            return
+        self._page_cache[key] = CachedPage(etag, last_modified, body, response.encoding)
+        self._page_cache.move_to_end(key)
+        if len(self._page_cache) > self.cache_size:
+            self._page_cache.popitem(last=False)
 
     def _record_fetch(self, url: str, status_code: int, error: str, metadata: Dict):
         """
@@ -271,14 +469,33 @@ class ScraperTool:
 
         DEBUGGING HELPER: Useful for analyzing scraper behavior.
         """
+        response_time = metadata['response_time']
         self._fetch_history.append({
             'url': url,
             'status_code': status_code,
             'error': error,
-            'metadata': metadata,
-            'timestamp': datetime.now()
+            'response_time': response_time,
+            'timestamp': metadata['timestamp']  # when the fetch started
         })
 
+        # Running totals for get_fetch_stats()
+        self._total_fetches += 1
+        if status_code == 200:
+            self._successes += 1
+        self._sum_response_time += response_time
+        if response_time < self._min_response_time:
+            self._min_response_time = response_time
+        if response_time > self._max_response_time:
+            self._max_response_time = response_time
+
+    def _reset_stats(self):
+        """Zero the running totals behind get_fetch_stats()."""
+        self._total_fetches = 0
+        self._successes = 0
+        self._sum_response_time = 0.0
+        self._min_response_time = math.inf
+        self._max_response_time = 0.0
+
     def get_fetch_stats(self) -> Dict:
         """
         Get statistics about fetch history.
@@ -288,30 +505,80 @@ class ScraperTool:
         Returns:
             Dict with success_rate, avg_response_time, total_fetches, etc.
         """
-        if not self._fetch_history:
+        total = self._total_fetches
+        if not total:
             return {
                 'total_fetches': 0,
                 'success_rate': 0.0,
                 'avg_response_time': 0.0
             }
 
-        total = len(self._fetch_history)
-        successes = sum(1 for f in self._fetch_history if f['status_code'] == 200)
-        response_times = [f['metadata']['response_time'] for f in self._fetch_history]
+        successes = self._successes
 
         return {
             'total_fetches': total,
             'successes': successes,
             'failures': total - successes,
-            'success_rate': successes / total if total > 0 else 0.0,
-            'avg_response_time': sum(response_times) / len(response_times) if response_times else 0.0,
-            'min_response_time': min(response_times) if response_times else 0.0,
-            'max_response_time': max(response_times) if response_times else 0.0
+            'success_rate': successes / total,
+            'avg_response_time': self._sum_response_time / total,
+            'min_response_time': self._min_response_time,
+            'max_response_time': self._max_response_time
         }
 
     def clear_history(self):
-        """Clear fetch history (useful for testing or memory management)."""
-        self._fetch_history = []
+        """Clear fetch history and stats (useful for testing or memory management)."""
+        self._fetch_history.clear()
+        self._reset_stats()
+
+    def export_history(self, path: Path) -> int:
+        """
+        Write the fetch history to path as JSON Lines (one fetch per line).
+
+        DEBUGGING HELPER: Load it into pandas, jq, or a spreadsheet.
+
+        Returns:
+            Number of records written
+        """
+        return write_json_lines(path, self._fetch_history)
+
+    def clear_cache(self):
+        """Forget all cached pages, so the next fetches download in full."""
+        self._page_cache.clear()
+
+
+def _decode_body(body: bytes, encoding: Optional[str]) -> str:
+    """
+    Decode a response body the way requests' Response.text does.
+
+    Uses the charset from the headers, or guesses one from the bytes when
+    the server didn't send any.
+    """
+    if encoding is None:
+        encoding = chardet.detect(body)['encoding'] if chardet is not None else 'utf-8'
+    try:
+        return str(body, encoding or 'utf-8', errors='replace')
+    except (LookupError, TypeError):
+        # Unknown codec name in the headers
+        return str(body, 'utf-8', errors='replace')
+
+
+_DEFAULT_SCRAPER: Optional[ScraperTool] = None
+
+
+def _get_default_scraper() -> ScraperTool:
+    """
+    Return the shared ScraperTool, creating it on the first call.
+
+    PERFORMANCE NOTE:
+    -----------------
+    A ScraperTool owns a connection pool. Sharing one between calls to
+    fetch_url() lets repeated fetches from the same host reuse a
+    keep-alive connection instead of opening a new one each time.
+    """
+    global _DEFAULT_SCRAPER
+    if _DEFAULT_SCRAPER is None:
+        _DEFAULT_SCRAPER = ScraperTool()
+    return _DEFAULT_SCRAPER
 
 
 # Convenience function for simple one-off fetches
@@ -336,9 +603,8 @@ def fetch_url(url: str, timeout: int = 30) -> Tuple[Optional[str], int, str]:
 
     TEACHING NOTE:
     --------------
-    This function creates a new ScraperTool instance for each call.
-    For repeated fetches, use ScraperTool directly to track history.
+    This function shares one ScraperTool (and its connection pool)
+    across calls. For your own fetch history, use ScraperTool directly.
     """
-    scraper = ScraperTool()
-    html, status, error, metadata = scraper.fetch_url(url, timeout)
+    html, status, error, metadata = _get_default_scraper().fetch_url(url, timeout)
     return (html, status, error)
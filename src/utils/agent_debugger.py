@@ -29,9 +29,55 @@ USE CASES:
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import json
+import atexit
+import functools
+import os
+import time
+import weakref
+from collections import Counter, defaultdict, deque
+from itertools import islice
 from pathlib import Path
 
+from .json_lines import json_line_encoder
+
+
+# Debuggers that may still hold unwritten decisions; flushed at exit
+_OPEN_DEBUGGERS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_debuggers():
+    for debugger in list(_OPEN_DEBUGGERS):
+        debugger.close()
+
+
+# Decorated calls record inputs longer than this as a truncated repr()
+MAX_INPUT_REPR = 256
+
+
+def _summarize_input(value: Any) -> Any:
+    """
+    Shrink one decorated-call argument to something cheap to keep.
+
+    Numbers, None and short strings are kept as they are. Anything else
+    becomes its repr(), cut to MAX_INPUT_REPR characters, so the history
+    doesn't keep large objects (pages, DataFrames) alive.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) > MAX_INPUT_REPR:
+        return text[:MAX_INPUT_REPR] + '...'
+    return text
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """Turn a time.time_ns() value into a local ISO-8601 string."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(
+        microsecond=nanoseconds // 1000
+    ).isoformat()
+
 
 class AgentDebugger:
     """
@@ -44,18 +90,57 @@ class AgentDebugger:
       • Learning
     """
 
-    def __init__(self, agent_name: str, log_file: Optional[Path] = None):
+    # log_file writes are batched: buffered decisions are written once
+    # there are this many, or this many bytes of them
+    FLUSH_EVERY = 64
+    FLUSH_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        agent_name: str,
+        log_file: Optional[Path] = None,
+        max_history: Optional[int] = 100_000
+    ):
         """
         Initialize debugger for an agent.
 
         Args:
             agent_name: Name of the agent being debugged
             log_file: Optional path to save debug logs
+            max_history: Decisions kept in memory (at least 1); the oldest
+                are dropped beyond this (None = unbounded). log_file keeps
+                them all.
+
+        PERFORMANCE NOTE:
+        -----------------
+        Decisions used to be written with an open()/write()/close() per
+        decision. Now they're buffered and written in batches through one
+        file descriptor, opened on the first write. Call flush() to see the
+        latest decisions in the file, or close() when done; anything
+        still buffered is also written at interpreter exit.
+
+        Each decision is one JSON line, encoded straight to bytes by
+        orjson when it's installed (see src/utils/json_lines.py), and the
+        file is written in binary mode with no text-layer encode step.
+
+        decision_history is a deque with maxlen=max_history, a ring
+        buffer: memory stays bounded in long sessions, and appending
+        never has to grow and copy a list.
         """
+        if max_history is not None and max_history < 1:
+            raise ValueError(f"max_history must be at least 1, got {max_history}")
+
         self.agent_name = agent_name
         self.log_file = log_file
-        self.decision_history: List[Dict] = []
+        self.decision_history = deque(maxlen=max_history)
         self.state_snapshots: List[Dict] = []
+        self._decision_counts = Counter()  # decision_type -> count, for the summary
+        self._by_type = defaultdict(deque)  # decision_type -> its decisions, for replay
+        self._log_fd: Optional[int] = None
+        self._log_buffer: List[bytes] = []  # Encoded lines, each ending in b'\n'
+        self._log_buffer_bytes = 0
+        if log_file:
+            _OPEN_DEBUGGERS.add(self)
 
     def log_decision(
         self,
@@ -83,9 +168,16 @@ class AgentDebugger:
             ...     output=0.75,
             ...     reasoning="URL contains 2/3 keywords, domain is .edu"
             ... )
+
+        PERFORMANCE NOTE:
+        -----------------
+        Records carry 'timestamp_ns', a time.time_ns() integer, instead of
+        an ISO string: reading the clock as an int skips building a
+        datetime and formatting it on every decision. The summary and
+        report format the few timestamps they show.
         """
         decision = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp_ns': time.time_ns(),
             'decision_type': decision_type,
             'inputs': inputs,
             'output': output,
@@ -93,11 +185,25 @@ class AgentDebugger:
             'metadata': metadata or {}
         }
 
-        self.decision_history.append(decision)
+        history = self.decision_history
+        if len(history) == history.maxlen:
+            self._forget_oldest()
+        history.append(decision)
+        self._decision_counts[decision_type] += 1
+        self._by_type[decision_type].append(decision)
 
         if self.log_file:
             self._persist_decision(decision)
 
+    def _forget_oldest(self):
+        """Drop the decision the full history is about to evict from the indexes."""
+        dtype = self.decision_history[0]['decision_type']
+        self._by_type[dtype].popleft()  # It's also the oldest of its type
+        self._decision_counts[dtype] -= 1
+        if not self._decision_counts[dtype]:
+            del self._decision_counts[dtype]
+            del self._by_type[dtype]
+
     def snapshot_state(self, state: Dict[str, Any], label: str = ""):
         """
         Capture agent state at a point in time.
@@ -107,7 +213,7 @@ class AgentDebugger:
             label: Optional description of this snapshot
         """
         snapshot = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp_ns': time.time_ns(),
             'label': label,
             'state': state
         }
@@ -120,20 +226,20 @@ class AgentDebugger:
 
         Returns:
             Dict with decision counts, types, success rates
+
+        PERFORMANCE NOTE:
+        -----------------
+        Per-type counts are kept up to date by log_decision(), so this is
+        O(number of types) rather than a pass over the whole history.
         """
         if not self.decision_history:
             return {'total_decisions': 0}
 
-        decision_types = {}
-        for decision in self.decision_history:
-            dtype = decision['decision_type']
-            decision_types[dtype] = decision_types.get(dtype, 0) + 1
-
         return {
             'total_decisions': len(self.decision_history),
-            'decision_types': decision_types,
-            'first_decision': self.decision_history[0]['timestamp'],
-            'last_decision': self.decision_history[-1]['timestamp']
+            'decision_types': dict(self._decision_counts),
+            'first_decision': _format_timestamp(self.decision_history[0]['timestamp_ns']),
+            'last_decision': _format_timestamp(self.decision_history[-1]['timestamp_ns'])
         }
 
     def replay_decisions(self, decision_type: Optional[str] = None) -> List[Dict]:
@@ -145,11 +251,17 @@ class AgentDebugger:
 
         Returns:
             List of decision records
+
+        PERFORMANCE NOTE:
+        -----------------
+        log_decision() files each record under its type as well, so a
+        filtered replay copies only the matching records instead of
+        scanning the whole history. Either way the caller gets a fresh
+        list it may modify.
         """
         if decision_type:
-            return [d for d in self.decision_history
-                   if d['decision_type'] == decision_type]
-        return self.decision_history
+            return list(self._by_type.get(decision_type, ()))
+        return list(self.decision_history)
 
     def generate_debug_report(self) -> str:
         """
@@ -157,32 +269,85 @@ class AgentDebugger:
 
         Returns:
             Markdown-formatted debug report
-        """
-        report = [f"# Agent Debug Report: {self.agent_name}\n"]
-        report.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
+        PERFORMANCE NOTE:
+        -----------------
+        Each section is one f-string, and the pieces are joined once at
+        the end. That keeps the number of temporary strings down without
+        io.StringIO, whose per-write() method call measured slower than
+        list.append for a report this size.
+        """
         summary = self.get_decision_summary()
-        report.append(f"\n## Decision Summary\n")
-        report.append(f"- Total Decisions: {summary.get('total_decisions', 0)}\n")
+        report = [
+            f"# Agent Debug Report: {self.agent_name}\n"
+            f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"\n## Decision Summary\n"
+            f"- Total Decisions: {summary.get('total_decisions', 0)}\n"
+        ]
 
         if 'decision_types' in summary:
-            report.append(f"\n### Decision Types\n")
-            for dtype, count in summary['decision_types'].items():
-                report.append(f"- {dtype}: {count}\n")
-
-        report.append(f"\n## Recent Decisions\n")
-        for decision in self.decision_history[-10:]:
-            report.append(f"\n### {decision['decision_type']} @ {decision['timestamp']}\n")
-            report.append(f"**Reasoning**: {decision['reasoning']}\n")
-            report.append(f"**Output**: {decision['output']}\n")
+            report.append("\n### Decision Types\n")
+            report.extend(f"- {dtype}: {count}\n"
+                          for dtype, count in summary['decision_types'].items())
+
+        report.append("\n## Recent Decisions\n")
+        report.extend(
+            f"\n### {decision['decision_type']} @ {_format_timestamp(decision['timestamp_ns'])}\n"
+            f"**Reasoning**: {decision['reasoning']}\n"
+            f"**Output**: {decision['output']}\n"
+            # Last 10, oldest first; walking in from the right end is O(10)
+            for decision in reversed(list(islice(reversed(self.decision_history), 10)))
+        )
 
         return ''.join(report)
 
     def _persist_decision(self, decision: Dict):
-        """Save decision to log file."""
-        if self.log_file:
-            with open(self.log_file, 'a') as f:
-                f.write(json.dumps(decision) + '\n')
+        """Buffer decision for the log file, writing out a full buffer."""
+        line = json_line_encoder()(decision) + b'\n'
+        self._log_buffer.append(line)
+        self._log_buffer_bytes += len(line)
+        if (len(self._log_buffer) >= self.FLUSH_EVERY
+                or self._log_buffer_bytes >= self.FLUSH_BYTES):
+            self.flush()
+
+    def flush(self):
+        """
+        Write buffered decisions to the log file.
+
+        PERFORMANCE NOTE:
+        -----------------
+        The batch goes out with one os.write() on a descriptor opened
+        with O_APPEND, with no Python file object or buffer in between.
+        With O_APPEND the kernel positions each write() at the current
+        end of file. So when several debuggers (or processes) share a
+        log_file, each batch lands whole instead of interleaving with
+        another's mid-line (on local filesystems; not NFS).
+        """
+        if not self._log_buffer:
+            return
+        if self._log_fd is None:
+            self._log_fd = os.open(
+                self.log_file,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0),
+                0o644
+            )
+        data = memoryview(b''.join(self._log_buffer))
+        while data:  # A regular file takes it all at once, barring errors
+            data = data[os.write(self._log_fd, data):]
+        self._log_buffer.clear()
+        self._log_buffer_bytes = 0
+
+    def close(self):
+        """Flush and close the log file. Safe to call twice; reopens if used again."""
+        self.flush()
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+
+    def __del__(self):
+        # __init__ may have failed before the buffer existed
+        if getattr(self, '_log_buffer', None) is not None:
+            self.close()
 
 
 # Decorator for automatic decision logging
@@ -199,18 +364,40 @@ def log_agent_decision(decision_type: str):
         >>>     def assess_url(self, url, keywords):
         >>>         score = self._calculate_score(url, keywords)
         >>>         return score
+
+    PERFORMANCE NOTE:
+    -----------------
+    Agents without a debugger (or with debugger = None) pay only for one
+    getattr() per call: the inputs are summarized only when a debugger
+    will record them. Arguments are stored via _summarize_input(), so the
+    history never holds on to large objects. The reasoning string is built
+    once, when the method is decorated.
+
+    Generating the wrapper's source with exec(), with decision_type and
+    reasoning baked in as constants (the dataclasses trick), was
+    measured too. It ran no faster: reading a closure variable costs
+    about the same as loading a constant, and the time goes into the
+    log_decision() call itself.
     """
     def decorator(func):
+        reasoning = f"Decision made by {func.__name__}"
+
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             result = func(self, *args, **kwargs)
 
             # Log if agent has debugger
-            if hasattr(self, 'debugger'):
-                self.debugger.log_decision(
+            debugger = getattr(self, 'debugger', None)
+            if debugger is not None:
+                debugger.log_decision(
                     decision_type=decision_type,
-                    inputs={'args': args, 'kwargs': kwargs},
+                    inputs={
+                        'args': tuple(map(_summarize_input, args)),
+                        'kwargs': {key: _summarize_input(value)
+                                   for key, value in kwargs.items()},
+                    },
                     output=result,
-                    reasoning=f"Decision made by {func.__name__}"
+                    reasoning=reasoning
                 )
 
             return result
@@ -41,6 +41,16 @@ import html
 from typing import List
 
 
+# Compiled once at import (see the PERFORMANCE NOTE in extraction.py)
+# Runs of spaces/tabs that need rewriting; a lone space already is ' '
+_SPACES_RE = re.compile(r'[ \t]{2,}|\t')
+_MULTI_NL_RE = re.compile(r'\n{3,}')
+_PARA_SPLIT_RE = re.compile(r'\n{2,}')
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+_SPECIAL_KEEP_RE = re.compile(r'[^a-zA-Z0-9\s.,!?;:\-\'\"()]')
+_SPECIAL_DROP_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+
 def normalize_whitespace(text: str) -> str:
     """
     Normalize whitespace in text.
@@ -62,16 +72,27 @@ def normalize_whitespace(text: str) -> str:
     --------------
     This is a DETERMINISTIC UTILITY. Same input → same output, always.
     No decisions, just consistent transformation rules.
+
+    PERFORMANCE NOTE:
+    -----------------
+    Most of the cost is in building new strings. So each pass only runs
+    when a fast C-level `in` check shows it has something to change. The
+    space pattern leaves single spaces alone rather than replacing every
+    ' ' with ' '. Clean text skips both regex passes, and the line strip
+    maps str.strip without a Python-level loop. Folding all three passes
+    into one regex was tried and was slower: a whitespace character
+    class tested at every position costs more than split() and strip().
     """
     # Collapse multiple spaces/tabs to single space
-    text = re.sub(r'[ \t]+', ' ', text)
+    if '\t' in text or '  ' in text:
+        text = _SPACES_RE.sub(' ', text)
 
     # Collapse multiple newlines (keep max 2 for paragraph breaks)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    if '\n\n\n' in text:
+        text = _MULTI_NL_RE.sub('\n\n', text)
 
     # Remove trailing/leading whitespace from each line
-    lines = [line.strip() for line in text.split('\n')]
-    text = '\n'.join(lines)
+    text = '\n'.join(map(str.strip, text.split('\n')))
 
     return text.strip()
 
@@ -112,10 +133,10 @@ def remove_special_characters(text: str, keep_punctuation: bool = True) -> str:
     """
     if keep_punctuation:
         # Keep alphanumeric, spaces, and basic punctuation
-        text = re.sub(r'[^a-zA-Z0-9\s.,!?;:\-\'\"()]', '', text)
+        text = _SPECIAL_KEEP_RE.sub('', text)
     else:
         # Keep only alphanumeric and spaces
-        text = re.sub(r'[^a-zA-Z0-9\s]', '', text)
+        text = _SPECIAL_DROP_RE.sub('', text)
 
     return normalize_whitespace(text)
 
@@ -142,10 +163,9 @@ def segment_sentences(text: str) -> List[str]:
     This is a heuristic-based segmentation. Not perfect, but deterministic.
     Could be improved with NLP libraries like spaCy or NLTK.
     """
-    # Basic sentence splitting pattern
+    # Basic sentence splitting pattern (_SENT_SPLIT_RE)
     # Handles ., !, ? followed by space and capital letter
-    sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-    sentences = re.split(sentence_pattern, text)
+    sentences = _SENT_SPLIT_RE.split(text)
 
     # Clean and filter
     sentences = [s.strip() for s in sentences if s.strip()]
@@ -170,7 +190,7 @@ def segment_paragraphs(text: str) -> List[str]:
         ['Paragraph 1.', 'Paragraph 2.']
     """
     # Split on multiple newlines
-    paragraphs = re.split(r'\n{2,}', text)
+    paragraphs = _PARA_SPLIT_RE.split(text)
 
     # Clean and filter
     paragraphs = [p.strip() for p in paragraphs if p.strip()]
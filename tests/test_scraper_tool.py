@@ -0,0 +1,73 @@
+"""
+Tests for ScraperTool's conditional-request page cache.
+
+The session is replaced with a mock that hands back canned
+requests.Response objects, so no network is needed.
+
+Run from the repository root:  python -m pytest tests
+"""
+
+import io
+from unittest import mock
+
+import requests
+
+from src.tools.scraper_tool import ScraperTool
+
+
+URL = 'https://example.com/page'
+PAGE = b'<html><body>the page</body></html>'
+
+
+def _response(status_code: int, body: bytes = b'', headers=None) -> requests.Response:
+    """Build a streamed response as the session would return it."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'OK' if status_code == 200 else 'Not Modified'
+    response.url = URL
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _scraper(*responses: requests.Response) -> ScraperTool:
+    """A ScraperTool whose session returns the given responses in order."""
+    scraper = ScraperTool()
+    scraper._session = mock.Mock()
+    scraper._session.get.side_effect = list(responses)
+    return scraper
+
+
+def test_304_revalidation_returns_cached_page():
+    scraper = _scraper(
+        _response(200, PAGE, {'ETag': '"a"'}),
+        _response(304, headers={'ETag': '"a"'}),
+    )
+
+    scraper.fetch_url(URL)
+    html, status, error, metadata = scraper.fetch_url(URL)
+
+    assert (html, status, error) == (PAGE.decode(), 200, '')
+    assert metadata['cached'] is True
+    assert metadata['content_length'] == len(PAGE)
+    sent_headers = scraper._session.get.call_args.kwargs['headers']
+    assert sent_headers['If-None-Match'] == '"a"'
+
+
+def test_304_for_caller_conditional_header_is_not_cached():
+    # The caller revalidates with their own validator; we hold no copy,
+    # so the 304 is passed through and its empty body must not be cached
+    headers = {'If-None-Match': '"a"'}
+    scraper = _scraper(
+        _response(304, headers={'ETag': '"a"'}),
+        _response(304, headers={'ETag': '"a"'}),
+    )
+
+    first = scraper.fetch_url(URL, headers=headers)
+    second = scraper.fetch_url(URL, headers=headers)
+
+    assert first[:3] == ('', 304, '')
+    assert second[:3] == ('', 304, '')
+    assert second[3]['cached'] is False
+    assert not scraper._page_cache